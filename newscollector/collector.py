@@ -24,6 +24,8 @@ from newscollector.utils.ai import (
     summarize_and_label,
     summarize_and_label_from_page,
 )
+from newscollector.utils import playwright_pool
+from newscollector.utils.http_client import aclose_shared_client
 from newscollector.utils.labeller import label_item
 from newscollector.utils.storage import configure_storage, save_daily_verdict, save_item
 from newscollector.utils.web_content import fetch_page_text
@@ -255,6 +257,7 @@ async def collect_platform(
             api_key = ai_cfg.get("ai_api_key", "")
             response_language = ai_cfg.get("ai_response_language") or None
             ai_timeout = float(ai_cfg.get("ai_request_timeout", 60.0))
+            cheap_model = ai_cfg.get("ai_cheap_model") or None
             ai_max_failures = int(ai_cfg.get("ai_max_failures_before_disable", 3))
             page_summary_enabled = ai_cfg.get("ai_page_summary_enabled", True)
             page_text_char_limit = int(ai_cfg.get("ai_page_char_limit", 12000))
@@ -303,6 +306,7 @@ async def collect_platform(
                                     api_key=api_key,
                                     response_language=response_language,
                                     timeout=ai_timeout,
+                                    cheap_model=cheap_model,
                                 )
                             page_summary_cache[cache_key] = (summary, labels)
 
@@ -315,6 +319,7 @@ async def collect_platform(
                             api_key=api_key,
                             response_language=response_language,
                             timeout=ai_timeout,
+                            cheap_model=cheap_model,
                         )
 
                     if summary is not None:
@@ -405,7 +410,14 @@ async def collect_all(
         for p in target_platforms
     ]
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    try:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        # Scraping collectors share one browser instance and per-item fetches
+        # share one HTTP client; tear both down with the run so they don't
+        # outlive the event loop
+        await playwright_pool.shutdown()
+        await aclose_shared_client()
 
     # Convert exceptions to error results
     final: list[CollectionResult] = []
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 from newscollector.models import CollectionResult, TrendingItem
@@ -11,6 +13,69 @@ from newscollector.models import CollectionResult, TrendingItem
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class AIConfig:
+    """AI platform-extraction settings, parsed from config once per collector.
+
+    Collectors previously re-read and re-coerced ten 'ai' keys on every
+    collection; this snapshots them at construction time.
+    """
+
+    enabled: bool = True
+    base_url: str = ""
+    model: str = ""
+    api_key: str = ""
+    response_language: str | None = None
+    html_char_limit: int = 160000
+    prompt_char_limit: int = 8000
+    max_items: int = 30
+    min_items: int = 6
+    timeout: float = 60.0
+    cache_ttl: float = 900.0
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None) -> AIConfig:
+        ai_cfg = (config.get("ai") or {}) if config else {}
+        return cls(
+            enabled=bool(ai_cfg.get("ai_platform_collection_enabled", True)),
+            base_url=ai_cfg.get("ai_base_url", ""),
+            model=ai_cfg.get("ai_model", ""),
+            api_key=ai_cfg.get("ai_api_key", ""),
+            response_language=ai_cfg.get("ai_response_language") or None,
+            html_char_limit=int(ai_cfg.get("ai_html_char_limit", 160000)),
+            prompt_char_limit=int(
+                ai_cfg.get("ai_extract_html_prompt_char_limit", 8000)
+            ),
+            max_items=int(ai_cfg.get("ai_platform_extract_max_items", 30)),
+            min_items=int(ai_cfg.get("ai_platform_min_items_before_fallback", 6)),
+            timeout=float(ai_cfg.get("ai_request_timeout", 60.0)),
+            cache_ttl=float(ai_cfg.get("ai_cache_ttl_seconds", 900)),
+        )
+
+
+def dedupe_by_heat(
+    items: list[TrendingItem], key: Callable[[TrendingItem], Any]
+) -> list[TrendingItem]:
+    """Collapse duplicate items, keeping the hottest copy per key.
+
+    Used by collectors that fan out over several locations and get
+    overlapping results back. Survivors are ordered by heat descending
+    and re-ranked from 1; a single dict pass keeps this O(n).
+    """
+    best: dict[Any, TrendingItem] = {}
+    for item in items:
+        k = key(item)
+        prev = best.get(k)
+        if prev is None or (item.heat or 0) > (prev.heat or 0):
+            best[k] = item
+    return [
+        item.model_copy(update={"rank": rank})
+        for rank, item in enumerate(
+            sorted(best.values(), key=lambda i: -(i.heat or 0)), start=1
+        )
+    ]
+
+
 class BaseCollector(ABC):
     """Abstract base class for all platform collectors.
 
@@ -21,6 +86,7 @@ class BaseCollector(ABC):
 
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         self.config = config or {}
+        self._ai_cfg = AIConfig.from_config(self.config)
 
     @property
     @abstractmethod
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
+from urllib.parse import quote
 
 from newscollector.models import CollectionResult, TrendingItem
 from newscollector.platforms.base import BaseCollector
-from newscollector.utils.http_client import create_client
+from newscollector.utils.http_client import create_client, json_body
 
 logger = logging.getLogger(__name__)
 
@@ -31,12 +33,12 @@ class BilibiliCollector(BaseCollector):
         items: list[TrendingItem] = []
 
         async with create_client() as client:
-            # Fetch ranking (hot videos)
-            ranking_items = await self._fetch_ranking(client)
+            # Ranking and hot search are independent requests — overlap them
+            ranking_items, hot_search_items = await asyncio.gather(
+                self._fetch_ranking(client),
+                self._fetch_hot_search(client),
+            )
             items.extend(ranking_items)
-
-            # Fetch hot search keywords
-            hot_search_items = await self._fetch_hot_search(client)
             items.extend(hot_search_items)
 
         return CollectionResult(
@@ -56,35 +58,37 @@ class BilibiliCollector(BaseCollector):
                 headers={"Referer": "https://www.bilibili.com"},
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = json_body(resp)
         except Exception as exc:
             logger.error("Bilibili ranking request failed: %s", exc)
             return []
 
-        items: list[TrendingItem] = []
-        result_list = data.get("data", {}).get("list", [])
-        for rank, video in enumerate(result_list[:30], start=1):
-            stat = video.get("stat", {})
-            items.append(
-                self._make_item(
-                    title=video.get("title", "Untitled"),
-                    url=f"https://www.bilibili.com/video/{video.get('bvid', '')}",
-                    source=video.get("owner", {}).get("name", "Unknown"),
-                    region="China",
-                    rank=rank,
-                    description=video.get("desc", "")[:300],
-                    heat=stat.get("view"),
-                    metadata={
-                        "bvid": video.get("bvid"),
-                        "like": stat.get("like"),
-                        "danmaku": stat.get("danmaku"),
-                        "reply": stat.get("reply"),
-                        "coin": stat.get("coin"),
-                        "duration": video.get("duration"),
-                    },
-                )
+        # Slice once and build the items in a single comprehension; the stat
+        # dict is pulled out per video so each field is one lookup
+        result_list = data.get("data", {}).get("list", [])[:30]
+        make_item = self._make_item
+        return [
+            make_item(
+                title=video.get("title", "Untitled"),
+                url=f"https://www.bilibili.com/video/{video.get('bvid', '')}",
+                source=video.get("owner", {}).get("name", "Unknown"),
+                region="China",
+                rank=rank,
+                description=video.get("desc", "")[:300],
+                heat=stat.get("view"),
+                metadata={
+                    "bvid": video.get("bvid"),
+                    "like": stat.get("like"),
+                    "danmaku": stat.get("danmaku"),
+                    "reply": stat.get("reply"),
+                    "coin": stat.get("coin"),
+                    "duration": video.get("duration"),
+                },
             )
-        return items
+            for rank, (video, stat) in enumerate(
+                ((v, v.get("stat", {})) for v in result_list), start=1
+            )
+        ]
 
     async def _fetch_hot_search(self, client: Any) -> list[TrendingItem]:
         """Fetch Bilibili hot search keywords."""
@@ -96,7 +100,7 @@ class BilibiliCollector(BaseCollector):
                 headers={"Referer": "https://www.bilibili.com"},
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = json_body(resp)
         except Exception as exc:
             logger.error("Bilibili hot search request failed: %s", exc)
             return []
@@ -107,7 +111,7 @@ class BilibiliCollector(BaseCollector):
             items.append(
                 self._make_item(
                     title=keyword,
-                    url=f"https://search.bilibili.com/all?keyword={keyword}",
+                    url=f"https://search.bilibili.com/all?keyword={quote(keyword)}",
                     source="Bilibili Hot Search",
                     region="China",
                     rank=rank,
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import logging
+import re
+from typing import Any
+from urllib.parse import quote, unquote
+
+import orjson
 
 from newscollector.models import CollectionResult, TrendingItem
 from newscollector.platforms.base import BaseCollector
+from newscollector.utils import ai_cache, playwright_pool
 from newscollector.utils.ai import extract_items_from_html, is_ai_configured
-from newscollector.utils.http_client import create_client
+from newscollector.utils.http_client import create_client, json_body
 from newscollector.utils.web_content import fetch_html, truncate_text
 
 logger = logging.getLogger(__name__)
@@ -16,6 +22,55 @@ logger = logging.getLogger(__name__)
 DOUYIN_HOT_URL = "https://www.douyin.com/hot"
 # Douyin hot board API (may work without browser)
 DOUYIN_HOT_API = "https://www.douyin.com/aweme/v1/web/hot/search/list/"
+# Candidate selectors for hot list entries on the rendered page
+DOUYIN_HOT_SEL = (
+    'div[class*="hot-list"] li, '
+    'ul[class*="rank-list"] li, '
+    'div[class*="trending"] a'
+)
+# Lines that are only a rank number, e.g. "1" or " 12 "
+_RANK_ONLY_RE = re.compile(r"^\s*\d+\s*$")
+# URL-encoded JSON state blob Douyin embeds in its pages
+_RENDER_DATA_RE = re.compile(r'<script[^>]*id="RENDER_DATA"[^>]*>(.+?)</script>', re.DOTALL)
+
+# Shared browser context options for the scraping fallback
+BROWSER_CONTEXT_OPTS: dict = {
+    "user_agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+    ),
+    "viewport": {"width": 1920, "height": 1080},
+    "locale": "zh-CN",
+}
+
+
+def _find_word_list(node: Any) -> list[dict[str, Any]]:
+    """Depth-first search for a word_list-shaped list inside parsed state."""
+    if isinstance(node, list):
+        if node and all(isinstance(e, dict) and "word" in e for e in node):
+            return [e for e in node if e.get("word")]
+        for child in node:
+            found = _find_word_list(child)
+            if found:
+                return found
+    elif isinstance(node, dict):
+        for child in node.values():
+            found = _find_word_list(child)
+            if found:
+                return found
+    return []
+
+
+def _extract_render_data_words(html: str) -> list[dict[str, Any]]:
+    """Parse the embedded RENDER_DATA blob and return its hot word list."""
+    m = _RENDER_DATA_RE.search(html or "")
+    if not m:
+        return []
+    try:
+        data = orjson.loads(unquote(m.group(1)))
+    except Exception:
+        return []
+    return _find_word_list(data)
 
 
 class DouyinCollector(BaseCollector):
@@ -62,39 +117,47 @@ class DouyinCollector(BaseCollector):
         )
 
     async def _fetch_via_ai(self) -> list[TrendingItem]:
-        ai_cfg = (self.config.get("ai") or {}) if self.config else {}
+        ai = self._ai_cfg
         if not is_ai_configured(self.config):
             return []
-        if not ai_cfg.get("ai_platform_collection_enabled", True):
+        if not ai.enabled:
             return []
 
-        base_url = ai_cfg.get("ai_base_url", "")
-        model = ai_cfg.get("ai_model", "")
-        api_key = ai_cfg.get("ai_api_key", "")
-        response_language = ai_cfg.get("ai_response_language") or None
-        html_char_limit = int(ai_cfg.get("ai_html_char_limit", 160000))
-        ai_input_limit = int(ai_cfg.get("ai_extract_html_prompt_char_limit", 8000))
-        max_items = int(ai_cfg.get("ai_platform_extract_max_items", 30))
-        min_items = int(ai_cfg.get("ai_platform_min_items_before_fallback", 6))
-        ai_timeout = float(ai_cfg.get("ai_request_timeout", 60.0))
-
-        html = await fetch_html(DOUYIN_HOT_URL, char_limit=html_char_limit)
+        html = await fetch_html(DOUYIN_HOT_URL, char_limit=ai.html_char_limit)
         if not html:
             return []
-        html_excerpt = truncate_text(html, char_limit=ai_input_limit)
 
-        extracted = await extract_items_from_html(
-            platform=self.platform_name,
-            page_url=DOUYIN_HOT_URL,
-            html_excerpt=html_excerpt,
-            base_url=base_url,
-            model=model,
-            api_key=api_key,
-            response_language=response_language,
-            max_items=max_items,
-            timeout=ai_timeout,
-        )
-        if len(extracted) < min_items:
+        # The page usually embeds its hot list as URL-encoded JSON; parsing
+        # that directly is both faster and more accurate than asking the LLM
+        word_list = _extract_render_data_words(html)[:50]
+        if len(word_list) >= ai.min_items:
+            logger.info(
+                "Douyin hot list parsed from embedded RENDER_DATA (%d items), skipping AI",
+                len(word_list),
+            )
+            return self._items_from_word_list(word_list)
+
+        html_excerpt = truncate_text(html, char_limit=ai.prompt_char_limit)
+
+        # Identical page content within the TTL means an identical extraction,
+        # so skip the (slow, paid) LLM round-trip on repeated scheduler ticks
+        key = ai_cache.cache_key(html_excerpt)
+        extracted = ai_cache.cache_get(key) if ai.cache_ttl > 0 else None
+        if extracted is None:
+            extracted = await extract_items_from_html(
+                platform=self.platform_name,
+                page_url=DOUYIN_HOT_URL,
+                html_excerpt=html_excerpt,
+                base_url=ai.base_url,
+                model=ai.model,
+                api_key=ai.api_key,
+                response_language=ai.response_language,
+                max_items=ai.max_items,
+                timeout=ai.timeout,
+            )
+            if extracted:
+                ai_cache.cache_set(key, extracted, ttl_seconds=ai.cache_ttl)
+        if len(extracted) < ai.min_items:
             logger.info(
                 "Douyin AI extraction returned %d item(s); falling back to API/selectors",
                 len(extracted),
@@ -112,7 +175,8 @@ class DouyinCollector(BaseCollector):
             items.append(
                 self._make_item(
                     title=title,
-                    url=entry.get("url") or f"https://www.douyin.com/search/{title}",
+                    url=entry.get("url")
+                    or f"https://www.douyin.com/search/{quote(title)}",
                     source=entry.get("source") or "Douyin",
                     region="China",
                     rank=rank,
@@ -137,40 +201,41 @@ class DouyinCollector(BaseCollector):
                     },
                 )
                 resp.raise_for_status()
-                data = resp.json()
+                data = json_body(resp)
             except Exception as exc:
                 logger.debug("Douyin API request failed (expected): %s", exc)
                 return []
 
-        word_list = data.get("data", {}).get("word_list", [])
-        items: list[TrendingItem] = []
-        for rank, entry in enumerate(word_list[:50], start=1):
-            word = entry.get("word", "")
-            hot_value = entry.get("hot_value", 0)
-            sentence_id = entry.get("sentence_id", "")
-
-            items.append(
-                self._make_item(
-                    title=word,
-                    url=f"https://www.douyin.com/search/{word}",
-                    source="Douyin",
-                    region="China",
-                    rank=rank,
-                    heat=int(hot_value) if hot_value else None,
-                    metadata={
-                        "sentence_id": sentence_id,
-                        "label": entry.get("label", ""),
-                    },
-                )
+        # Slice once and build the items in a single comprehension
+        return self._items_from_word_list(data.get("data", {}).get("word_list", [])[:50])
+
+    def _items_from_word_list(self, word_list: list[dict[str, Any]]) -> list[TrendingItem]:
+        """Build items from a Douyin word_list (API response or embedded state)."""
+        make_item = self._make_item
+        return [
+            make_item(
+                title=word,
+                url=f"https://www.douyin.com/search/{quote(word)}",
+                source="Douyin",
+                region="China",
+                rank=rank,
+                heat=int(hot_value) if (hot_value := entry.get("hot_value", 0)) else None,
+                metadata={
+                    "sentence_id": entry.get("sentence_id", ""),
+                    "label": entry.get("label", ""),
+                },
             )
-        return items
+            for rank, (entry, word) in enumerate(
+                ((e, e.get("word", "")) for e in word_list), start=1
+            )
+        ]
 
     async def _fetch_via_playwright(self) -> list[TrendingItem]:
         """Fall back to Playwright-based scraping for Douyin hot list."""
         logger.info("Fetching Douyin hot list via Playwright")
 
         try:
-            from playwright.async_api import async_playwright
+            from playwright.async_api import async_playwright  # noqa: F401
         except ImportError:
             logger.error("Playwright not installed, cannot scrape Douyin")
             return []
@@ -178,51 +243,55 @@ class DouyinCollector(BaseCollector):
         items: list[TrendingItem] = []
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    user_agent=(
-                        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
-                    ),
-                    viewport={"width": 1920, "height": 1080},
-                    locale="zh-CN",
-                )
+            browser = await playwright_pool.get_browser()
+            context = await browser.new_context(**BROWSER_CONTEXT_OPTS)
+            try:
                 page = await context.new_page()
 
-                await page.goto(DOUYIN_HOT_URL, wait_until="networkidle", timeout=30000)
-                await page.wait_for_timeout(3000)
-
-                # Look for hot list items on the page
-                hot_items = await page.query_selector_all(
-                    'div[class*="hot-list"] li, '
-                    'ul[class*="rank-list"] li, '
-                    'div[class*="trending"] a'
+                # Wait for the hot list itself instead of networkidle + a fixed
+                # sleep; returns as soon as entries are attached to the DOM
+                await page.goto(
+                    DOUYIN_HOT_URL, wait_until="domcontentloaded", timeout=15000
+                )
+                try:
+                    await page.wait_for_selector(
+                        DOUYIN_HOT_SEL, state="attached", timeout=8000
+                    )
+                except Exception:
+                    logger.debug("Douyin hot list selector did not appear in time")
+
+                # Extract all hot list fields in one in-browser pass instead of
+                # one CDP round-trip per field per item
+                raw_items = await page.eval_on_selector_all(
+                    DOUYIN_HOT_SEL,
+                    """els => els.slice(0, 50).map(el => {
+                        const a = el.querySelector('a');
+                        return {
+                            text: el.innerText.trim(),
+                            href: a ? a.getAttribute('href') : null,
+                        };
+                    })""",
                 )
 
-                for rank, item in enumerate(hot_items[:50], start=1):
-                    text = (await item.inner_text()).strip()
-                    link_el = await item.query_selector("a")
-                    href = None
-                    if link_el:
-                        href = await link_el.get_attribute("href")
-                        if href and not href.startswith("http"):
-                            href = f"https://www.douyin.com{href}"
-
-                    # Clean up the text (may include rank numbers)
-                    lines = [line.strip() for line in text.split("\n") if line.strip()]
+                for rank, raw in enumerate(raw_items, start=1):
+                    text = (raw.get("text") or "").strip()
+                    href = raw.get("href")
+                    if href and not href.startswith("http"):
+                        href = f"https://www.douyin.com{href}"
+
+                    # Clean up the text: first line that is not a rank number
                     title = ""
-                    for line in lines:
-                        # Skip pure numbers (rank indicators)
-                        if not line.isdigit():
-                            title = line
+                    for line in text.split("\n"):
+                        if line.strip() and not _RANK_ONLY_RE.match(line):
+                            title = line.strip()
                             break
 
                     if title:
                         items.append(
                             self._make_item(
                                 title=title,
-                                url=href or f"https://www.douyin.com/search/{title}",
+                                url=href
+                                or f"https://www.douyin.com/search/{quote(title)}",
                                 source="Douyin",
                                 region="China",
                                 rank=rank,
@@ -230,7 +299,8 @@ class DouyinCollector(BaseCollector):
                             )
                         )
 
-                await browser.close()
+            finally:
+                await context.close()
         except Exception as exc:
             logger.error("Douyin Playwright scraping failed: %s", exc)
 
@@ -6,9 +6,22 @@ import logging
 
 from newscollector.models import CollectionResult, TrendingItem
 from newscollector.platforms.base import BaseCollector
+from newscollector.utils import playwright_pool
 
 logger = logging.getLogger(__name__)
 
+# Post/reel links on the explore page
+INSTAGRAM_POST_SEL = 'article a[href*="/p/"], article a[href*="/reel/"]'
+
+# Shared browser context options for explore-page scraping
+BROWSER_CONTEXT_OPTS: dict = {
+    "user_agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+    ),
+    "viewport": {"width": 1920, "height": 1080},
+}
+
 
 class InstagramCollector(BaseCollector):
     """Collect trending content from Instagram.
@@ -30,7 +43,7 @@ class InstagramCollector(BaseCollector):
         logger.info("Fetching Instagram trending via Playwright")
 
         try:
-            from playwright.async_api import async_playwright
+            from playwright.async_api import async_playwright  # noqa: F401
         except ImportError:
             return CollectionResult(
                 platform=self.platform_name,
@@ -41,46 +54,47 @@ class InstagramCollector(BaseCollector):
         items: list[TrendingItem] = []
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    user_agent=(
-                        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
-                    ),
-                    viewport={"width": 1920, "height": 1080},
-                )
+            browser = await playwright_pool.get_browser()
+            context = await browser.new_context(**BROWSER_CONTEXT_OPTS)
+            try:
                 page = await context.new_page()
 
-                # Navigate to Instagram explore page
+                # Navigate to Instagram explore page and wait for post links to
+                # attach instead of networkidle + a fixed sleep
                 await page.goto(
                     "https://www.instagram.com/explore/",
-                    wait_until="networkidle",
-                    timeout=30000,
+                    wait_until="domcontentloaded",
+                    timeout=15000,
                 )
-
-                # Wait for content to load
-                await page.wait_for_timeout(3000)
+                try:
+                    await page.wait_for_selector(
+                        INSTAGRAM_POST_SEL, state="attached", timeout=8000
+                    )
+                except Exception:
+                    logger.debug("Instagram explore posts did not appear in time")
 
                 # Try to extract post data from the page
-                # Instagram loads data dynamically; we intercept embedded JSON or scrape visible elements
-                posts = await page.query_selector_all(
-                    'article a[href*="/p/"], article a[href*="/reel/"]'
+                # Instagram loads data dynamically; we intercept embedded JSON or scrape visible elements.
+                # All fields are read in one in-browser pass to avoid per-post CDP round-trips.
+                raw_posts = await page.eval_on_selector_all(
+                    INSTAGRAM_POST_SEL,
+                    """els => els.slice(0, 30).map(el => {
+                        const img = el.querySelector('img');
+                        return {
+                            href: el.getAttribute('href'),
+                            alt: img ? (img.getAttribute('alt') || '') : '',
+                        };
+                    })""",
                 )
 
-                for rank, post in enumerate(posts[:30], start=1):
-                    href = await post.get_attribute("href")
+                for rank, raw in enumerate(raw_posts, start=1):
+                    href = raw.get("href")
                     url = (
                         f"https://www.instagram.com{href}"
                         if href and not href.startswith("http")
                         else href
                     )
-
-                    # Try to get alt text from images inside the link
-                    img = await post.query_selector("img")
-                    alt_text = ""
-                    if img:
-                        alt_text = await img.get_attribute("alt") or ""
+                    alt_text = raw.get("alt") or ""
 
                     items.append(
                         self._make_item(
@@ -95,7 +109,8 @@ class InstagramCollector(BaseCollector):
                         )
                     )
 
-                await browser.close()
+            finally:
+                await context.close()
         except Exception as exc:
             return CollectionResult(
                 platform=self.platform_name,
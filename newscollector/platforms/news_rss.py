@@ -2,20 +2,40 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from html import unescape
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
 import feedparser
 import yaml
+from bs4 import BeautifulSoup
+
+try:
+    # libyaml C binding — several times faster than the pure-Python loader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 from newscollector.models import CollectionResult, TrendingItem
 from newscollector.platforms.base import BaseCollector
+from newscollector.utils import feed_cache
+from newscollector.utils.http_client import create_client
 
 logger = logging.getLogger(__name__)
 
 SOURCES_FILE = Path(__file__).resolve().parent.parent.parent / "config" / "sources.yaml"
 
+# Upper bound on feeds fetched at once; keeps peak memory flat on big source
+# lists while preserving nearly all of the concurrency win
+FEED_CONCURRENCY = 10
+
 # Region name normalization map
 REGION_ALIASES: dict[str, str] = {
     "eu": "europe",
@@ -43,27 +63,130 @@ REGION_LANGUAGES: dict[str, list[str]] = {
 }
 
 
+@functools.lru_cache(maxsize=4)
+def _load_sources_uncached(
+    path: str, use_financial: bool, mtime_ns: int
+) -> dict[str, list[dict[str, Any]]]:
+    """Read and parse sources.yaml; cached until the file's mtime changes."""
+    with open(path, encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    if use_financial and data.get("rss_sources_financial"):
+        return data.get("rss_sources_financial", {})
+    return data.get("rss_sources", {})
+
+
 def _load_sources(topic: str | None = None) -> dict[str, list[dict[str, Any]]]:
     """Load RSS sources from sources.yaml.
 
     When topic is 'financial' or 'business', loads rss_sources_financial if present;
-    otherwise loads rss_sources.
+    otherwise loads rss_sources. Parsed results are memoized per file mtime so
+    repeated collect() calls skip the YAML parse while the file is unchanged.
     """
     if not SOURCES_FILE.exists():
         logger.warning("sources.yaml not found at %s", SOURCES_FILE)
         return {}
-    with open(SOURCES_FILE, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
     use_financial = (topic or "").strip().lower() in ("financial", "business")
-    if use_financial and data.get("rss_sources_financial"):
-        return data.get("rss_sources_financial", {})
-    return data.get("rss_sources", {})
+    return _load_sources_uncached(
+        str(SOURCES_FILE), use_financial, SOURCES_FILE.stat().st_mtime_ns
+    )
+
+
+# Lowercased, set-typed view of REGION_LANGUAGES computed once at import
+_REGION_LANGUAGES_LOWER: dict[str, frozenset[str]] = {
+    region: frozenset(lang.lower() for lang in langs)
+    for region, langs in REGION_LANGUAGES.items()
+}
 
 
 def _normalize_region(region: str) -> str:
     return REGION_ALIASES.get(region.lower(), region.lower())
 
 
+@dataclass(frozen=True)
+class SourcesIndex:
+    """Precomputed lookup tables over an rss_sources mapping.
+
+    Each feed is stored as a (feed_info, original_region_key) pair so items
+    keep the region label exactly as written in sources.yaml.
+    """
+
+    regions: tuple[str, ...]
+    all_feeds: tuple[tuple[dict[str, Any], str], ...]
+    by_region: dict[str, tuple[tuple[dict[str, Any], str], ...]]
+    by_region_lang: dict[str, tuple[tuple[dict[str, Any], str], ...]]
+
+
+# One-slot cache; _load_sources returns the same dict object while the file
+# is unchanged, so an identity check is enough to reuse the index
+_index_cache: tuple[dict[str, list[dict[str, Any]]], SourcesIndex] | None = None
+
+
+def _index_sources(sources: dict[str, list[dict[str, Any]]]) -> SourcesIndex:
+    """Build (or reuse) region/language lookup tables for a sources mapping."""
+    global _index_cache
+    if _index_cache is not None and _index_cache[0] is sources:
+        return _index_cache[1]
+
+    all_feeds: list[tuple[dict[str, Any], str]] = []
+    grouped: dict[str, list[tuple[dict[str, Any], str]]] = {}
+    for region_key, feeds in sources.items():
+        pairs = [(feed_info, region_key) for feed_info in feeds]
+        all_feeds.extend(pairs)
+        grouped.setdefault(_normalize_region(region_key), []).extend(pairs)
+
+    by_region_lang: dict[str, tuple[tuple[dict[str, Any], str], ...]] = {}
+    for norm, pairs in grouped.items():
+        allowed = _REGION_LANGUAGES_LOWER.get(norm)
+        if allowed:
+            pairs = [
+                pair
+                for pair in pairs
+                if (pair[0].get("language") or "").strip().lower() in allowed
+            ]
+        by_region_lang[norm] = tuple(pairs)
+
+    index = SourcesIndex(
+        regions=tuple(sources.keys()),
+        all_feeds=tuple(all_feeds),
+        by_region={norm: tuple(pairs) for norm, pairs in grouped.items()},
+        by_region_lang=by_region_lang,
+    )
+    _index_cache = (sources, index)
+    return index
+
+
+def _fast_parse(data: bytes) -> list[dict[str, str]]:
+    """Minimal streaming parse of RSS 2.0 / Atom feeds.
+
+    Extracts only title, link, and summary for the first 20 entries via
+    expat-backed iterparse, skipping all the date handling and dict proxying
+    that dominates feedparser's cost. Raises on malformed XML; callers fall
+    back to feedparser for anything this can't handle.
+    """
+    entries: list[dict[str, str]] = []
+    for _event, elem in ET.iterparse(BytesIO(data), events=("end",)):
+        tag = elem.tag.rsplit("}", 1)[-1]
+        if tag not in ("item", "entry"):
+            continue
+        entry: dict[str, str] = {}
+        for child in elem:
+            ctag = child.tag.rsplit("}", 1)[-1]
+            if ctag == "title":
+                entry["title"] = (child.text or "").strip()
+            elif ctag == "link":
+                href = child.get("href")
+                if "link" not in entry or child.get("rel") in (None, "alternate"):
+                    entry["link"] = href or (child.text or "").strip()
+            elif ctag in ("description", "summary"):
+                entry["summary"] = child.text or ""
+        if entry.get("title") or entry.get("link"):
+            entries.append(entry)
+        elem.clear()
+        if len(entries) >= 20:
+            break
+    return entries
+
+
 class NewsRSSCollector(BaseCollector):
     """Collect top headlines from RSS feeds of major news publishers."""
 
@@ -84,38 +207,73 @@ class NewsRSSCollector(BaseCollector):
                 error="No RSS sources configured. Check config/sources.yaml.",
             )
 
-        # Filter by region if specified
+        # Region and language filtering are precomputed lookups on the index
+        index = _index_sources(sources)
         if region:
             norm = _normalize_region(region)
-            filtered = {
-                k: v for k, v in sources.items() if _normalize_region(k) == norm
-            }
-            if not filtered:
+            if norm not in index.by_region:
                 return CollectionResult(
                     platform=self.platform_name,
                     region=region,
                     error=f"No RSS sources found for region '{region}'. "
-                    f"Available: {', '.join(sources.keys())}",
+                    f"Available: {', '.join(index.regions)}",
                 )
-            sources = filtered
+            # Only feeds in the region's official language(s)
+            to_fetch = index.by_region_lang[norm]
+        else:
+            to_fetch = index.all_feeds
 
-        # When region is set, use only feeds in the region's official language(s)
-        allowed_languages: list[str] | None = None
-        if region:
-            norm = _normalize_region(region)
-            allowed_languages = REGION_LANGUAGES.get(norm)
-            if allowed_languages:
-                allowed_languages = [lang.lower() for lang in allowed_languages]
+        # Global publishers can be listed under several regions with the same
+        # URL; group by URL so each feed is fetched and parsed exactly once
+        by_url: dict[str, list[tuple[dict[str, Any], str]]] = {}
+        for feed_info, region_key in to_fetch:
+            by_url.setdefault(feed_info.get("url", ""), []).append(
+                (feed_info, region_key)
+            )
+
+        async def parse_unique(
+            consumers: list[tuple[dict[str, Any], str]], client: Any
+        ) -> list[TrendingItem]:
+            feed_info, region_key = consumers[0]
+            feed_items = await self._parse_feed(feed_info, region_key, client)
+            if len(consumers) == 1:
+                return feed_items
+            # Re-emit the parsed entries under each additional region that
+            # referenced the same URL
+            out = list(feed_items)
+            for extra_info, extra_region in consumers[1:]:
+                extra_name = extra_info.get("name", "Unknown")
+                out.extend(
+                    item.model_copy(
+                        update={"region": extra_region, "source": extra_name}
+                    )
+                    for item in feed_items
+                )
+            return out
+
+        # Feeds are independent network fetches — run them concurrently over a
+        # shared client so wall time is roughly the slowest feed, not the sum.
+        # A semaphore bounds in-flight fetches (and the buffers they hold) and
+        # as_completed folds each feed's items in as soon as it finishes.
+        sem = asyncio.Semaphore(FEED_CONCURRENCY)
+
+        async def guarded(
+            consumers: list[tuple[dict[str, Any], str]], client: Any
+        ) -> list[TrendingItem]:
+            async with sem:
+                return await parse_unique(consumers, client)
 
         items: list[TrendingItem] = []
-        for region_key, feeds in sources.items():
-            for feed_info in feeds:
-                if allowed_languages is not None:
-                    feed_lang = (feed_info.get("language") or "").strip().lower()
-                    if not feed_lang or feed_lang not in allowed_languages:
-                        continue
-                feed_items = await self._parse_feed(feed_info, region_key)
-                items.extend(feed_items)
+        async with create_client(timeout=20.0) as client:
+            tasks = [
+                asyncio.create_task(guarded(consumers, client))
+                for consumers in by_url.values()
+            ]
+            for fut in asyncio.as_completed(tasks):
+                try:
+                    items.extend(await fut)
+                except Exception as exc:
+                    logger.error("RSS feed task failed: %s", exc)
 
         return CollectionResult(
             platform=self.platform_name,
@@ -123,8 +281,34 @@ class NewsRSSCollector(BaseCollector):
             items=items,
         )
 
+    async def _fetch(
+        self, url: str, client: Any
+    ) -> tuple[bytes | None, Any, list[dict[str, Any]] | None]:
+        """Fetch feed bytes over the shared client using a conditional GET.
+
+        Returns (raw_bytes, response_headers, cached_entries). When the feed
+        answers 304 Not Modified, raw_bytes is None and the entries from the
+        previous fetch are returned instead.
+        """
+        cached = feed_cache.get(url)
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        try:
+            resp = await client.get(url, headers=headers or None)
+            if resp.status_code == 304 and cached is not None:
+                return None, resp.headers, cached.entries
+            resp.raise_for_status()
+            return resp.content, resp.headers, None
+        except Exception as exc:
+            logger.debug("Async fetch of %s failed: %s", url, exc)
+            return None, None, None
+
     async def _parse_feed(
-        self, feed_info: dict[str, Any], region_key: str
+        self, feed_info: dict[str, Any], region_key: str, client: Any = None
     ) -> list[TrendingItem]:
         """Parse a single RSS feed and return trending items."""
         name = feed_info.get("name", "Unknown")
@@ -134,31 +318,98 @@ class NewsRSSCollector(BaseCollector):
             return []
 
         logger.info("Parsing RSS feed: %s (%s)", name, url)
-        try:
-            feed = feedparser.parse(url)
-        except Exception as exc:
-            logger.error("Failed to parse feed %s: %s", name, exc)
-            return []
+        raw = resp_headers = cached_entries = None
+        if client is not None:
+            raw, resp_headers, cached_entries = await self._fetch(url, client)
 
-        items: list[TrendingItem] = []
-        for rank, entry in enumerate(feed.entries[:20], start=1):
-            items.append(
-                self._make_item(
-                    title=entry.get("title", "Untitled"),
-                    url=entry.get("link"),
-                    source=name,
-                    region=region_key,
-                    rank=rank,
-                    description=_clean_summary(entry.get("summary", "")),
-                )
+        if cached_entries is not None:
+            logger.debug("Feed %s unchanged (304), reusing cached entries", name)
+            entries: list[dict[str, Any]] | None = cached_entries
+        else:
+            # Straightforward RSS/Atom goes through the cheap iterparse path;
+            # anything it chokes on falls back to feedparser
+            entries = None
+            if raw is not None:
+                try:
+                    entries = await asyncio.to_thread(_fast_parse, raw)
+                except Exception as exc:
+                    logger.debug(
+                        "Fast XML parse of %s failed, using feedparser: %s", name, exc
+                    )
+            if not entries:
+                try:
+                    # Parse pre-fetched bytes; if the async fetch failed, let
+                    # feedparser retrieve the URL itself as before. Parsing is
+                    # CPU-bound, so run it off the event loop to keep other
+                    # feeds' fetches moving while XML is chewed through.
+                    feed = await asyncio.to_thread(
+                        feedparser.parse, raw if raw is not None else url
+                    )
+                except Exception as exc:
+                    logger.error("Failed to parse feed %s: %s", name, exc)
+                    return []
+                entries = feed.entries[:20]
+
+            # Remember validators + entries so an unchanged feed costs one
+            # header exchange next time instead of a download and a parse
+            if raw is not None and entries and resp_headers is not None:
+                etag = resp_headers.get("ETag")
+                last_modified = resp_headers.get("Last-Modified")
+                if etag or last_modified:
+                    feed_cache.set(
+                        url,
+                        etag=etag,
+                        last_modified=last_modified,
+                        entries=[
+                            {
+                                "title": e.get("title", "Untitled"),
+                                "link": e.get("link"),
+                                "summary": e.get("summary", ""),
+                            }
+                            for e in entries
+                        ],
+                    )
+
+        # Build the items in a single comprehension; bound lookups hoisted
+        # out since FeedParserDict.get goes through a slow __getattr__ chain
+        # 20 times per feed otherwise
+        make_item = self._make_item
+        clean = _clean_summary
+        return [
+            make_item(
+                title=entry.get("title", "Untitled"),
+                url=entry.get("link"),
+                source=name,
+                region=region_key,
+                rank=rank,
+                description=clean(entry.get("summary", "")),
             )
-        return items
+            for rank, entry in enumerate(entries, start=1)
+        ]
+
+
+# Only 500 chars of text survive, so don't parse arbitrarily large summaries
+_SUMMARY_HTML_CAP = 8192
+
+# Tag stripping for small summary snippets: drop script/style bodies first,
+# then remaining tags, then collapse whitespace
+_SCRIPT_STYLE_RE = re.compile(
+    r"<(script|style)[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# Escape hatch: route summaries through BeautifulSoup again if a feed's
+# markup turns out too mangled for the regex stripper
+USE_BS4_FALLBACK = False
 
 
 def _clean_summary(text: str) -> str:
     """Strip HTML tags from feed summaries."""
-    from bs4 import BeautifulSoup
-
     if not text:
         return ""
-    return BeautifulSoup(text, "lxml").get_text(strip=True)[:500]
+    text = text[:_SUMMARY_HTML_CAP]
+    if USE_BS4_FALLBACK:
+        return BeautifulSoup(text, "lxml").get_text(strip=True)[:500]
+    text = _TAG_RE.sub("", _SCRIPT_STYLE_RE.sub("", text))
+    return unescape(_WS_RE.sub(" ", text)).strip()[:500]
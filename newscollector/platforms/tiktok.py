@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from typing import Any
 
 from newscollector.models import CollectionResult, TrendingItem
 from newscollector.platforms.base import BaseCollector
+from newscollector.utils import playwright_pool
 from newscollector.utils.ai import extract_items_from_html, is_ai_configured
 from newscollector.utils.web_content import fetch_html, truncate_text
 
@@ -14,6 +16,56 @@ logger = logging.getLogger(__name__)
 
 TIKTOK_DISCOVER_URL = "https://www.tiktok.com/discover"
 
+# One in-browser pass over the discover page: a single joined-selector
+# query walks the DOM once and buckets each node as topic or creator, so
+# Python gets both lists in one CDP round-trip. Rows are positional
+# arrays, not objects — a smaller JSON envelope and tuple unpacking on
+# the Python side instead of per-field dict lookups.
+_EXTRACT_ALL_JS = """
+() => {
+    const topics = [];
+    const creators = [];
+    const nodes = document.querySelectorAll(
+        '[data-e2e="explore-feed-item"], [data-e2e="discover-user-item"]'
+    );
+    nodes.forEach(item => {
+        if (item.matches('[data-e2e="explore-feed-item"]')) {
+            const titleEl = item.querySelector('[data-e2e="explore-feed-title"]');
+            const descEl = item.querySelector('[data-e2e="explore-feed-desc"]');
+            const videos = item.querySelectorAll('[data-e2e="explore-feed-video"] a');
+            const videoLinks = [];
+            videos.forEach(v => {
+                if (v.href) videoLinks.push(v.href);
+            });
+            const title = titleEl?.textContent?.trim() || '';
+            if (title) {
+                // Slice before trimming so a KB-long description is never
+                // copied whole just to throw most of it away
+                const rawDesc = descEl?.textContent || '';
+                topics.push([
+                    title,
+                    (rawDesc.length > 300 ? rawDesc.slice(0, 300) : rawDesc).trim(),
+                    videoLinks.length,
+                    videoLinks[0] || null,
+                ]);
+            }
+        } else {
+            const titleEl = item.querySelector('[data-e2e="discover-user-title"]');
+            const subEl = item.querySelector('[data-e2e="discover-user-subtitle"]');
+            const followersEl = item.querySelector(
+                '[data-e2e="discover-user-followers-vv"]'
+            );
+            creators.push([
+                titleEl?.textContent?.trim() || '',
+                subEl?.textContent?.trim() || '',
+                followersEl?.textContent?.trim() || '',
+            ]);
+        }
+    });
+    return {topics: topics, creators: creators};
+}
+"""
+
 
 class TikTokCollector(BaseCollector):
     """Collect trending content from TikTok.
@@ -42,7 +94,7 @@ class TikTokCollector(BaseCollector):
             )
 
         try:
-            from playwright.async_api import async_playwright
+            from playwright.async_api import async_playwright  # noqa: F401
         except ImportError:
             return CollectionResult(
                 platform=self.platform_name,
@@ -54,33 +106,63 @@ class TikTokCollector(BaseCollector):
         items: list[TrendingItem] = []
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    user_agent=(
-                        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
-                    ),
-                    viewport={"width": 1920, "height": 1080},
-                )
+            # Launching Chromium costs seconds; a context on the shared
+            # browser is orders of magnitude cheaper
+            browser = await playwright_pool.get_browser()
+            context = await browser.new_context(
+                user_agent=(
+                    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+                    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+                ),
+                viewport={"width": 1920, "height": 1080},
+            )
+            try:
                 page = await context.new_page()
 
+                # Wait for the data actually read instead of networkidle plus
+                # a blanket 5s sleep — analytics beacons keep the discover
+                # page from ever going network-idle, so that wait nearly
+                # always ran to its cap
                 await page.goto(
                     TIKTOK_DISCOVER_URL,
-                    wait_until="networkidle",
-                    timeout=30000,
+                    wait_until="domcontentloaded",
+                    timeout=15000,
                 )
-                await page.wait_for_timeout(5000)
-
-                # 1) Trending topics / hashtags
-                topic_items = await self._extract_topics(page)
-                items.extend(topic_items)
-
-                # 2) Trending creators
-                creator_items = await self._extract_creators(page)
-                items.extend(creator_items)
-
-                await browser.close()
+                try:
+                    await page.wait_for_selector(
+                        '[data-e2e="explore-feed-item"], '
+                        '[data-e2e="discover-user-item"]',
+                        state="attached",
+                        timeout=10000,
+                    )
+                except Exception:
+                    logger.debug("TikTok discover items did not appear in time")
+
+                # Topics and creators hydrate from separate XHRs; once one
+                # family has painted, give the other a short window so a fast
+                # first paint doesn't produce a topics-only result
+                try:
+                    await page.wait_for_function(
+                        "() => document.querySelector("
+                        "'[data-e2e=\"explore-feed-item\"]')"
+                        " && document.querySelector("
+                        "'[data-e2e=\"discover-user-item\"]')",
+                        timeout=3000,
+                    )
+                except Exception:
+                    logger.debug(
+                        "TikTok second discover section absent; extracting "
+                        "what rendered"
+                    )
+
+                # Topics and creators come back from one evaluate call
+                extracted = await self._extract_all(page)
+                items.extend(self._topics_to_items(extracted.get("topics") or []))
+                items.extend(
+                    self._creators_to_items(extracted.get("creators") or [])
+                )
+            finally:
+                await context.close()
         except Exception as exc:
             return CollectionResult(
                 platform=self.platform_name,
@@ -102,174 +184,94 @@ class TikTokCollector(BaseCollector):
             items=items,
         )
 
-    async def _extract_topics(self, page: Any) -> list[TrendingItem]:
-        """Extract trending hashtag/topic feeds from the discover page."""
-        logger.info("Extracting TikTok trending topics")
-
+    async def _extract_all(self, page: Any) -> dict[str, list[list[Any]]]:
+        """Run the single-pass extraction script, returning topics and creators."""
         try:
-            topics = await page.evaluate("""
-                () => {
-                    const results = [];
-                    const feedItems = document.querySelectorAll(
-                        '[data-e2e="explore-feed-item"]'
-                    );
-                    feedItems.forEach((item, i) => {
-                        const titleEl = item.querySelector(
-                            '[data-e2e="explore-feed-title"]'
-                        );
-                        const descEl = item.querySelector(
-                            '[data-e2e="explore-feed-desc"]'
-                        );
-                        const videos = item.querySelectorAll(
-                            '[data-e2e="explore-feed-video"] a'
-                        );
-                        const videoLinks = [];
-                        videos.forEach(v => {
-                            if (v.href) videoLinks.push(v.href);
-                        });
-                        const title = titleEl?.textContent?.trim() || '';
-                        if (title) {
-                            results.push({
-                                title: title,
-                                desc: descEl?.textContent?.trim()?.substring(0, 300) || '',
-                                videoCount: videoLinks.length,
-                                sampleVideo: videoLinks[0] || null,
-                            });
-                        }
-                    });
-                    return results;
-                }
-            """)
+            extracted = await page.evaluate(_EXTRACT_ALL_JS)
         except Exception as exc:
-            logger.error("Failed to extract TikTok topics: %s", exc)
-            return []
+            logger.error("Failed to extract TikTok discover data: %s", exc)
+            return {"topics": [], "creators": []}
+        logger.info(
+            "Extracted %d trending topics and %d creators from TikTok",
+            len(extracted.get("topics") or []),
+            len(extracted.get("creators") or []),
+        )
+        return extracted
 
-        items: list[TrendingItem] = []
-        for rank, topic in enumerate(topics, start=1):
-            title = topic["title"]
+    def _topics_to_items(self, topics: list[list[Any]]) -> Iterator[TrendingItem]:
+        """Yield TrendingItems from extracted topic rows."""
+        for rank, (title, desc, video_count, sample_video) in enumerate(
+            topics, start=1
+        ):
             # Build a URL: hashtag titles start with #
             tag_name = title.lstrip("#")
-            url = f"https://www.tiktok.com/tag/{tag_name}"
-
-            items.append(
-                self._make_item(
-                    title=title,
-                    url=url,
-                    source="TikTok",
-                    region="Global",
-                    rank=rank,
-                    description=topic.get("desc") or None,
-                    metadata={
-                        "type": "trending_topic",
-                        "video_count": topic.get("videoCount", 0),
-                        "sample_video": topic.get("sampleVideo"),
-                    },
-                )
+            yield self._make_item(
+                title=title,
+                url=f"https://www.tiktok.com/tag/{tag_name}",
+                source="TikTok",
+                region="Global",
+                rank=rank,
+                description=desc or None,
+                metadata={
+                    "type": "trending_topic",
+                    "video_count": video_count,
+                    "sample_video": sample_video,
+                },
             )
 
-        logger.info("Extracted %d trending topics from TikTok", len(items))
-        return items
-
-    async def _extract_creators(self, page: Any) -> list[TrendingItem]:
-        """Extract trending/popular creators from the discover page."""
-        logger.info("Extracting TikTok trending creators")
-
-        try:
-            creators = await page.evaluate("""
-                () => {
-                    const results = [];
-                    const items = document.querySelectorAll(
-                        '[data-e2e="discover-user-item"]'
-                    );
-                    items.forEach((item, i) => {
-                        const titleEl = item.querySelector(
-                            '[data-e2e="discover-user-title"]'
-                        );
-                        const subEl = item.querySelector(
-                            '[data-e2e="discover-user-subtitle"]'
-                        );
-                        const followersEl = item.querySelector(
-                            '[data-e2e="discover-user-followers-vv"]'
-                        );
-                        const link = item.querySelector('a[href]');
-                        results.push({
-                            name: titleEl?.textContent?.trim() || '',
-                            username: subEl?.textContent?.trim() || '',
-                            followers: followersEl?.textContent?.trim() || '',
-                            href: link?.getAttribute('href') || '',
-                        });
-                    });
-                    return results;
-                }
-            """)
-        except Exception as exc:
-            logger.error("Failed to extract TikTok creators: %s", exc)
-            return []
-
-        items: list[TrendingItem] = []
-        for rank, creator in enumerate(creators, start=1):
-            name = creator.get("name", "")
-            username = creator.get("username", "")
+    def _creators_to_items(self, creators: list[list[Any]]) -> Iterator[TrendingItem]:
+        """Yield TrendingItems from extracted creator rows."""
+        rank = 0
+        for name, username, followers in creators:
             if not name and not username:
                 continue
+            rank += 1
 
             title = f"{name} ({username})" if name and username else (name or username)
             handle = username.lstrip("@")
             url = f"https://www.tiktok.com/@{handle}" if handle else None
 
-            items.append(
-                self._make_item(
-                    title=title,
-                    url=url,
-                    source="TikTok",
-                    region="Global",
-                    rank=rank,
-                    description=f"Followers: {creator.get('followers', 'N/A')}",
-                    metadata={
-                        "type": "trending_creator",
-                        "username": username,
-                        "followers": creator.get("followers", ""),
-                    },
-                )
+            yield self._make_item(
+                title=title,
+                url=url,
+                source="TikTok",
+                region="Global",
+                rank=rank,
+                description=f"Followers: {followers or 'N/A'}",
+                metadata={
+                    "type": "trending_creator",
+                    "username": username,
+                    "followers": followers,
+                },
             )
 
-        logger.info("Extracted %d trending creators from TikTok", len(items))
-        return items
-
     async def _collect_via_ai(self) -> list[TrendingItem]:
-        ai_cfg = (self.config.get("ai") or {}) if self.config else {}
+        ai = self._ai_cfg
         if not is_ai_configured(self.config):
             return []
-        if not ai_cfg.get("ai_platform_collection_enabled", True):
+        if not ai.enabled:
             return []
 
-        base_url = ai_cfg.get("ai_base_url", "")
-        model = ai_cfg.get("ai_model", "")
-        api_key = ai_cfg.get("ai_api_key", "")
-        response_language = ai_cfg.get("ai_response_language") or None
-        html_char_limit = int(ai_cfg.get("ai_html_char_limit", 160000))
-        ai_input_limit = int(ai_cfg.get("ai_extract_html_prompt_char_limit", 8000))
-        max_items = int(ai_cfg.get("ai_platform_extract_max_items", 30))
-        min_items = int(ai_cfg.get("ai_platform_min_items_before_fallback", 6))
-        ai_timeout = float(ai_cfg.get("ai_request_timeout", 60.0))
-
-        html = await fetch_html(TIKTOK_DISCOVER_URL, char_limit=html_char_limit)
+        # The prompt only ever sees prompt_char_limit chars from the front
+        # of the page, so cap the streamed download there instead of
+        # buffering ai_html_char_limit (typically 20x larger) first
+        html = await fetch_html(TIKTOK_DISCOVER_URL, char_limit=ai.prompt_char_limit)
         if not html:
             return []
-        html_excerpt = truncate_text(html, char_limit=ai_input_limit)
+        html_excerpt = truncate_text(html, char_limit=ai.prompt_char_limit)
 
         extracted = await extract_items_from_html(
             platform=self.platform_name,
             page_url=TIKTOK_DISCOVER_URL,
             html_excerpt=html_excerpt,
-            base_url=base_url,
-            model=model,
-            api_key=api_key,
-            response_language=response_language,
-            max_items=max_items,
-            timeout=ai_timeout,
+            base_url=ai.base_url,
+            model=ai.model,
+            api_key=ai.api_key,
+            response_language=ai.response_language,
+            max_items=ai.max_items,
+            timeout=ai.timeout,
         )
-        if len(extracted) < min_items:
+        if len(extracted) < ai.min_items:
             logger.info(
                 "TikTok AI extraction returned %d item(s); falling back to selectors",
                 len(extracted),
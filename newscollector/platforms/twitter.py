@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+from itertools import islice
 from typing import Any
 
 from newscollector.models import CollectionResult, TrendingItem
-from newscollector.platforms.base import BaseCollector
-from newscollector.utils.http_client import create_client
+from newscollector.platforms.base import BaseCollector, dedupe_by_heat
+from newscollector.utils.http_client import create_client, json_body
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +32,13 @@ REGION_WOEIDS: dict[str, list[dict[str, Any]]] = {
 }
 
 
+@functools.lru_cache(maxsize=32)
+def _resolve_locations(region: str | None) -> tuple[dict[str, Any], ...]:
+    """Normalize a region name and resolve its WOEID locations (memoized)."""
+    key = (region or "global").lower().replace(" ", "_")
+    return tuple(REGION_WOEIDS.get(key, REGION_WOEIDS["global"]))
+
+
 class TwitterCollector(BaseCollector):
     """Collect trending topics from X/Twitter API v2."""
 
@@ -53,17 +63,25 @@ class TwitterCollector(BaseCollector):
                 "Set 'twitter.bearer_token' in config.yaml.",
             )
 
-        region_key = (region or "global").lower().replace(" ", "_")
-        locations = REGION_WOEIDS.get(region_key, REGION_WOEIDS["global"])
+        locations = _resolve_locations(region)
 
         items: list[TrendingItem] = []
         async with create_client(
             headers={"Authorization": f"Bearer {bearer}"}
         ) as client:
-            for loc in locations:
-                loc_items = await self._fetch_trends(client, loc)
+            # Each WOEID is an independent request — fetch them concurrently
+            # so multi-location regions pay one round trip of latency.
+            # _fetch_trends handles its own errors and returns [] on failure.
+            for loc_items in await asyncio.gather(
+                *(self._fetch_trends(client, loc) for loc in locations)
+            ):
                 items.extend(loc_items)
 
+        # Overlapping WOEIDs return the same trend more than once; keep the
+        # hottest copy of each name, ordered by tweet volume
+        if len(locations) > 1:
+            items = dedupe_by_heat(items, key=lambda i: i.title)
+
         return CollectionResult(
             platform=self.platform_name,
             region=region,
@@ -89,7 +107,7 @@ class TwitterCollector(BaseCollector):
                 params={"id": woeid},
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = json_body(resp)
         except Exception as exc:
             logger.error("Twitter API request failed for %s: %s", loc_name, exc)
             return []
@@ -97,7 +115,7 @@ class TwitterCollector(BaseCollector):
         items: list[TrendingItem] = []
         if data and isinstance(data, list) and len(data) > 0:
             trends = data[0].get("trends", [])
-            for rank, trend in enumerate(trends[:50], start=1):
+            for rank, trend in enumerate(islice(trends, 50), start=1):
                 tweet_volume = trend.get("tweet_volume")
                 items.append(
                     self._make_item(
@@ -3,16 +3,22 @@
 from __future__ import annotations
 
 import logging
+from itertools import islice
+from urllib.parse import quote
 
 from newscollector.models import CollectionResult, TrendingItem
 from newscollector.platforms.base import BaseCollector
-from newscollector.utils.http_client import create_client
+from newscollector.utils.http_client import create_client, json_body
 
 logger = logging.getLogger(__name__)
 
 # Weibo's public hot search endpoint (no auth required)
 WEIBO_HOT_SEARCH_URL = "https://weibo.com/ajax/side/hotSearch"
 
+# Search URL for a hot topic; the word must be percent-encoded or CJK
+# topics produce invalid URLs
+_SEARCH_URL_FMT = "https://s.weibo.com/weibo?q=%23{}%23".format
+
 
 class WeiboCollector(BaseCollector):
     """Collect hot search topics from Weibo."""
@@ -35,7 +41,7 @@ class WeiboCollector(BaseCollector):
                     headers={"Referer": "https://weibo.com"},
                 )
                 resp.raise_for_status()
-                data = resp.json()
+                data = json_body(resp)
             except Exception as exc:
                 return CollectionResult(
                     platform=self.platform_name,
@@ -44,28 +50,28 @@ class WeiboCollector(BaseCollector):
                 )
 
         realtime = data.get("data", {}).get("realtime", [])
-        items: list[TrendingItem] = []
-        for rank, entry in enumerate(realtime[:50], start=1):
-            word = entry.get("word", entry.get("note", ""))
-            label_name = entry.get("label_name", "")
-            raw_hot = entry.get("raw_hot", entry.get("num", 0))
-
-            items.append(
-                self._make_item(
-                    title=word,
-                    url=f"https://s.weibo.com/weibo?q=%23{word}%23",
-                    source="Weibo",
-                    region="China",
-                    rank=rank,
-                    heat=int(raw_hot) if raw_hot else None,
-                    metadata={
-                        "label": label_name,
-                        "category": entry.get("category", ""),
-                        "is_hot": entry.get("is_hot", 0),
-                        "is_new": entry.get("is_new", 0),
-                    },
-                )
+        make_item = self._make_item
+        items: list[TrendingItem] = [
+            make_item(
+                title=(word := entry.get("word", entry.get("note", ""))),
+                url=_SEARCH_URL_FMT(quote(word, safe="")),
+                source="Weibo",
+                region="China",
+                rank=rank,
+                heat=(
+                    int(raw_hot)
+                    if (raw_hot := entry.get("raw_hot", entry.get("num", 0)))
+                    else None
+                ),
+                metadata={
+                    "label": entry.get("label_name", ""),
+                    "category": entry.get("category", ""),
+                    "is_hot": entry.get("is_hot", 0),
+                    "is_new": entry.get("is_new", 0),
+                },
             )
+            for rank, entry in enumerate(islice(realtime, 50), start=1)
+        ]
 
         return CollectionResult(
             platform=self.platform_name,
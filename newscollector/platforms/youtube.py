@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 from typing import Any
 
 from newscollector.models import CollectionResult, TrendingItem
-from newscollector.platforms.base import BaseCollector
-from newscollector.utils.http_client import create_client
+from newscollector.platforms.base import BaseCollector, dedupe_by_heat
+from newscollector.utils.http_client import create_client, json_body
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +35,13 @@ REGION_CODES: dict[str, list[dict[str, str]]] = {
 }
 
 
+@functools.lru_cache(maxsize=32)
+def _resolve_regions(region: str | None) -> tuple[dict[str, str], ...]:
+    """Normalize a region name and resolve its YouTube region codes (memoized)."""
+    key = (region or "global").lower().replace(" ", "_")
+    return tuple(REGION_CODES.get(key, REGION_CODES["global"]))
+
+
 class YouTubeCollector(BaseCollector):
     """Collect trending videos from YouTube Data API v3."""
 
@@ -57,8 +66,7 @@ class YouTubeCollector(BaseCollector):
                 "Set 'youtube.api_key' in config.yaml.",
             )
 
-        region_key = (region or "global").lower().replace(" ", "_")
-        regions = REGION_CODES.get(region_key, REGION_CODES["global"])
+        regions = _resolve_regions(region)
         if not regions:
             return CollectionResult(
                 platform=self.platform_name,
@@ -68,10 +76,19 @@ class YouTubeCollector(BaseCollector):
 
         items: list[TrendingItem] = []
         async with create_client() as client:
-            for reg in regions:
-                reg_items = await self._fetch_trending(client, api_key, reg)
+            # Independent per-region requests — run them concurrently (six
+            # for europe). _fetch_trending returns [] on failure, so gather
+            # never raises here.
+            for reg_items in await asyncio.gather(
+                *(self._fetch_trending(client, api_key, reg) for reg in regions)
+            ):
                 items.extend(reg_items)
 
+        # The same video often trends in several countries; keep the copy
+        # with the highest view count, ordered by views
+        if len(regions) > 1:
+            items = dedupe_by_heat(items, key=lambda i: i.url)
+
         return CollectionResult(
             platform=self.platform_name,
             region=region,
@@ -98,7 +115,7 @@ class YouTubeCollector(BaseCollector):
                 },
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = json_body(resp)
         except Exception as exc:
             logger.error("YouTube API request failed for %s: %s", region_name, exc)
             return []
@@ -2,14 +2,180 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import os
+import random
+import re
 from typing import Any
 
-from openai import AsyncOpenAI
+import orjson
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    AsyncOpenAI,
+    BadRequestError,
+    RateLimitError,
+)
+
+from newscollector.utils import ai_cache
 
 logger = logging.getLogger(__name__)
 
+# How long successful per-item AI responses are reused, keyed on
+# (model, prompt). The same title/description or financial report often
+# comes around again — duplicate items across sources, re-runs of the
+# same daily feed — and a cache hit skips the whole LLM round-trip.
+_RESPONSE_CACHE_TTL = 86400.0
+
+# AsyncOpenAI clients cached per (base_url, api_key, timeout). Constructing
+# a client builds a fresh httpx connection pool, so per-call clients pay a
+# TCP+TLS handshake on every enrichment request; reusing one keeps the
+# connection warm across the hundreds of calls a collection run makes.
+# The pool binds to the event loop it first sends on, so the cache is tied
+# to the running loop and rebuilt when a new loop starts (each CLI command
+# runs its own asyncio.run).
+_clients: dict[tuple[str, str, float], AsyncOpenAI] = {}
+_clients_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_client(base_url: str, api_key: str, timeout: float) -> AsyncOpenAI:
+    """Return a cached AsyncOpenAI client for this loop and credentials."""
+    global _clients_loop
+    loop = asyncio.get_running_loop()
+    if _clients_loop is not loop:
+        _clients.clear()
+        _clients_loop = loop
+    key = (base_url, api_key, timeout)
+    client = _clients.get(key)
+    if client is None:
+        client = _clients[key] = AsyncOpenAI(
+            base_url=base_url, api_key=api_key, timeout=timeout
+        )
+    return client
+
+
+# Cap on concurrent in-flight LLM requests, so batch workloads don't
+# overwhelm the provider (or trip its rate limiter). Like the client
+# cache, the semaphore is tied to the running loop.
+_MAX_INFLIGHT = int(os.environ.get("NEWSCOLLECTOR_AI_MAX_INFLIGHT", "64"))
+_sem: asyncio.Semaphore | None = None
+_sem_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Return the in-flight request semaphore for the running loop."""
+    global _sem, _sem_loop
+    loop = asyncio.get_running_loop()
+    if _sem is None or _sem_loop is not loop:
+        _sem = asyncio.Semaphore(_MAX_INFLIGHT)
+        _sem_loop = loop
+    return _sem
+
+
+# Base URLs whose provider rejected response_format={"type": "json_object"};
+# calls to them fall back to prompt-only JSON enforcement
+_no_json_object: set[str] = set()
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Whether an API failure is worth retrying.
+
+    Connection failures, timeouts (an APIConnectionError subclass), rate
+    limits, and 5xx server errors can succeed on a later attempt. Everything
+    else — bad API key, unknown model, context-length overflow — is
+    permanent and retrying just adds latency.
+    """
+    if isinstance(exc, (APIConnectionError, RateLimitError)):
+        return True
+    if isinstance(exc, APIStatusError):
+        return exc.status_code >= 500
+    return False
+
+
+async def _create_completion(
+    client: AsyncOpenAI, *, model: str, prompt: str, attempts: int = 3
+) -> str:
+    """Make one chat-completions call, retrying transient errors with backoff.
+
+    Structured JSON output (response_format json_object) is requested when
+    the provider supports it — every prompt here demands JSON, and the mode
+    spares the model emitting fence markers and the caller re-prompting on
+    malformed output. A provider that rejects it is remembered and served
+    plain requests from then on.
+
+    Transient failures (connection errors, timeouts, rate limits, 5xx) are
+    retried with jittered exponential backoff (0.5s doubling, capped at 8s);
+    permanent errors such as auth failures or an unknown model are re-raised
+    immediately, as is the last transient failure, for the caller's existing
+    error handling. Returns the response content string.
+    """
+    base = str(client.base_url)
+    kwargs: dict[str, Any] = {}
+    if base not in _no_json_object:
+        kwargs["response_format"] = {"type": "json_object"}
+
+    attempt = 0
+    while True:
+        try:
+            async with _get_semaphore():
+                response = await client.chat.completions.create(
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                    **kwargs,
+                )
+        except Exception as e:
+            if isinstance(e, BadRequestError) and "response_format" in kwargs:
+                # Provider doesn't support structured output; downgrade
+                # without consuming the retry budget
+                logger.debug(
+                    "Provider at %s rejected response_format; disabling: %s",
+                    base,
+                    _err_text(e),
+                )
+                _no_json_object.add(base)
+                del kwargs["response_format"]
+                continue
+            if not _is_transient(e):
+                raise
+            attempt += 1
+            if attempt >= attempts:
+                raise
+            delay = min(0.5 * (2 ** (attempt - 1)), 8.0) * (0.5 + random.random() / 2)
+            logger.debug(
+                "AI request failed (attempt %d/%d), retrying in %.1fs: %s",
+                attempt,
+                attempts,
+                delay,
+                _err_text(e),
+            )
+            await asyncio.sleep(delay)
+        else:
+            return response.choices[0].message.content or ""
+
+
+async def _chat(
+    prompt: str,
+    *,
+    base_url: str,
+    model: str,
+    api_key: str,
+    timeout: float,
+    log_label: str = "AI",
+) -> str | None:
+    """One chat-completions round-trip: cached client, retry, semaphore.
+
+    Returns the response content string, or None on transport/API failure
+    (logged under log_label). All five public AI coroutines funnel through
+    here so transport-level behavior lives in one place.
+    """
+    client = _get_client(base_url, api_key, timeout)
+    try:
+        return await _create_completion(client, model=model, prompt=prompt)
+    except Exception as e:
+        logger.warning("%s request failed: %s", log_label, _err_text(e))
+        return None
+
 
 def _err_text(exc: Exception) -> str:
     text = str(exc).strip()
@@ -19,6 +185,80 @@ def _err_text(exc: Exception) -> str:
 # Default topic categories for label hints (AI may return others)
 LABEL_HINTS = "financial, sports, politics, game, entertainment, technology, science, health, world"
 
+# Prompts estimated at or below this size are eligible for the cheaper
+# model tier when one is configured
+_CHEAP_MODEL_MAX_TOKENS = 2000
+
+# Conservative per-call budget for verdict prompts; chunking splits
+# further when the formatted items would exceed it
+_VERDICT_PROMPT_TOKEN_BUDGET = 24000
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token estimate for prompt budgeting (~4 chars per token).
+
+    A real tokenizer is not worth a dependency here: the estimate only
+    decides chunk sizing and model routing, both of which tolerate being
+    off by a factor well within the heuristic's error.
+    """
+    return len(text) // 4 + 1
+
+# Invariant prompt scaffolding, hoisted so the builders only format the
+# variable fields instead of reassembling these multi-line blocks per call
+# (the verdict builders run once per chunk, the summary builders once per
+# item).
+_SUMMARY_JSON_KEYS = """Respond with valid JSON only, no other text:
+Each object keys:
+- summary (required, non-empty string)
+- labels (required, array of 3 non-empty strings)"""
+
+_VERDICT_JSON_KEYS = """Return valid JSON only with exactly these keys:
+Each object keys:
+- summary (required, non-empty string)
+- global_political_score (required, integer 0-100)
+- global_economic_score (required, integer 0-100)
+- domestic_political_score (required, integer 0-100)
+- domestic_economic_score (required, integer 0-100)
+
+Scoring rules:
+- 0 means severe instability/crisis, 100 means very stable/healthy conditions.
+- Scores must be integers between 0 and 100."""
+
+_VERDICT_SCORE_DEFINITIONS = """Score definitions:
+- global_political_score: Reflects international/geopolitical political stability (wars, diplomacy, international conflicts, global governance).
+- global_economic_score: Reflects international/global economic conditions (trade, global markets, international finance, commodities).
+- domestic_political_score: Reflects domestic/internal political stability (local government, elections, civil unrest, policy changes within countries).
+- domestic_economic_score: Reflects domestic/local economic conditions (employment, local markets, inflation, business conditions within countries)."""
+
+_FINANCIAL_JSON_KEYS = """Return valid JSON only with exactly these keys:
+Each object keys:
+- summary (required, non-empty string)
+- health_score (required, integer 0-100)
+- potential_score (required, integer 0-100)
+
+Scoring rules:
+- health_score (0-100): Current financial health based on profitability, balance sheet strength, cash flow, and debt levels. 0 = near-bankruptcy/critical, 50 = average, 100 = exceptionally strong.
+- potential_score (0-100): Expected performance in the next quarter based on growth trends, market position, and financial trajectory. 0 = severe decline expected, 50 = stable, 100 = strong growth expected.
+- Scores must be integers between 0 and 100.
+- Base scores on the financial data provided. Be realistic and data-driven."""
+
+
+# Match ```json ... ``` or ``` ... ``` (fenced code)
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?```", re.DOTALL)
+# First { or [ in the content, where an embedded JSON payload starts
+_JSON_START_RE = re.compile(r"[\[{]")
+
+
+def _looks_complete(text: str) -> bool:
+    """Cheap truncation check: a complete JSON object/array ends with } or ].
+
+    Truncated responses (the model hit its token limit mid-payload) can
+    never parse, so spotting them from the last character skips a doomed
+    full-document parse on every retry attempt.
+    """
+    text = text.rstrip()
+    return bool(text) and text[-1] in "}]"
+
 
 def _extract_json_text(content: str) -> dict[str, Any] | list[dict[str, Any]] | None:
     """Extract and parse JSON from LLM response content.
@@ -33,42 +273,32 @@ def _extract_json_text(content: str) -> dict[str, Any] | list[dict[str, Any]] |
         return None
 
     # Try to find JSON in markdown code blocks first
-    # Handle both ```json and ``` (fenced code)
-    import re
-
-    # Match ```json ... ``` or ``` ... ```
-    fence_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", content, re.DOTALL)
+    fence_match = _FENCE_RE.search(content)
     if fence_match:
         extracted = fence_match.group(1).strip()
         # Verify it looks like JSON
-        if extracted.startswith("{") or extracted.startswith("["):
+        if extracted.startswith(("{", "[")) and _looks_complete(extracted):
             try:
-                return json.loads(extracted)
-            except json.JSONDecodeError:
-                print(content)
-                pass
-
-    # Try to find JSON object/array directly in the content
-    # Look for first { or [ and try to find matching closing bracket
-    json_start = -1
-    for i, char in enumerate(content):
-        if char == "{":
-            json_start = i
-            break
-        if char == "[":
-            json_start = i
-            break
-
-    if json_start >= 0:
-        # Find the end using our helper function
+                return orjson.loads(extracted)
+            except orjson.JSONDecodeError:
+                logger.debug("Fenced block is not valid JSON: %s", content)
+
+    # Otherwise look for a JSON object/array embedded directly in the
+    # content: the first { or [ starts the candidate, _find_json_end
+    # tracks brace nesting to locate its end
+    start_match = _JSON_START_RE.search(content)
+    if start_match:
+        json_start = start_match.start()
         json_end = _find_json_end(content[json_start:])
         if json_end > 0:
             extracted = content[json_start : json_start + json_end].strip()
-            try:
-                return json.loads(extracted)
-            except json.JSONDecodeError:
-                print(content)
-                pass
+            if _looks_complete(extracted):
+                try:
+                    return orjson.loads(extracted)
+                except orjson.JSONDecodeError:
+                    logger.debug(
+                        "Embedded JSON candidate failed to parse: %s", content
+                    )
 
     # No JSON found or parse failed
     return None
@@ -129,15 +359,44 @@ def _build_prompt(
     return f"""Summarize this news item in 1–2 short sentences, then assign exactly 3 topic labels that are most relevant.{lang_instruction}
 Suggested label categories (use these or similar): {LABEL_HINTS}
 
-Respond with valid JSON only, no other text:
-Each object keys:
-- summary (required, non-empty string)
-- labels (required, array of 3 non-empty strings)
+{_SUMMARY_JSON_KEYS}
 
 Content:
 {content}"""
 
 
+def _build_batch_prompt(
+    items: list[tuple[str, str | None]],
+    response_language: str | None = None,
+) -> str:
+    """Build prompt to summarize and label several items in one call."""
+    lang_instruction = ""
+    if response_language and response_language.strip():
+        lang_instruction = f" Respond in {response_language.strip()} for both the summaries and the labels.\n\n"
+
+    def fmt(idx: int, title: str, description: str | None) -> str:
+        content = (title or "").strip()
+        if description and description.strip():
+            content += "\n" + description.strip()
+        return f"{idx}. {content or '(no content)'}"
+
+    numbered = "\n\n".join(
+        fmt(idx, title, description)
+        for idx, (title, description) in enumerate(items, start=1)
+    )
+
+    return f"""Summarize each of the following {len(items)} news items in 1–2 short sentences, then assign exactly 3 topic labels per item.{lang_instruction}
+Suggested label categories (use these or similar): {LABEL_HINTS}
+
+Respond with valid JSON only, no other text. Return one object with key "results": an array with exactly {len(items)} entries, one per item in input order.
+Each entry keys:
+- summary (required, non-empty string)
+- labels (required, array of 3 non-empty strings)
+
+Items:
+{numbered}"""
+
+
 def _build_page_summary_prompt(
     title: str,
     page_text: str,
@@ -158,10 +417,7 @@ Suggested label categories (use these or similar): {LABEL_HINTS}
 
 Use this title as context: {clean_title or "(no title)"}
 
-Respond with valid JSON only, no other text:
-Each object keys:
-- summary (required, non-empty string)
-- labels (required, array of 3 non-empty strings)
+{_SUMMARY_JSON_KEYS}
 
 Page text:
 {clean_page}"""
@@ -231,7 +487,7 @@ def _normalize_extracted_items(value: Any, max_items: int) -> list[dict[str, Any
         seen_titles.add(title_key)
 
         url = str(raw.get("url") or "").strip() or None
-        if url and not (url.startswith("http://") or url.startswith("https://")):
+        if url and not url.startswith(("http://", "https://")):
             url = None
 
         source = str(raw.get("source") or "").strip() or None
@@ -270,25 +526,35 @@ def _normalize_extracted_items(value: Any, max_items: int) -> list[dict[str, Any
     return normalized
 
 
+def _format_one_verdict_item(idx: int, item: dict[str, Any]) -> str:
+    """Format a single item snippet for a verdict prompt."""
+    title = str(item.get("title") or "").strip()
+    summary = str(item.get("summary") or item.get("description") or "").strip()
+    source = str(item.get("source") or "").strip()
+    platform = str(item.get("platform") or "").strip()
+    region = str(item.get("region") or "").strip()
+    snippet = f"{idx}. {title}"
+    if summary:
+        snippet += f"\nSummary: {summary}"
+    if source or platform or region:
+        snippet += (
+            f"\nMeta: source={source or 'unknown'}, "
+            f"platform={platform or 'unknown'}, region={region or 'unknown'}"
+        )
+    return snippet
+
+
 def _format_items_for_verdict(items: list[dict[str, Any]], start_idx: int = 1) -> str:
     """Format items into a numbered list for verdict prompts."""
-    snippets: list[str] = []
-    for idx, item in enumerate(items, start=start_idx):
-        title = str(item.get("title") or "").strip()
-        summary = str(item.get("summary") or item.get("description") or "").strip()
-        source = str(item.get("source") or "").strip()
-        platform = str(item.get("platform") or "").strip()
-        region = str(item.get("region") or "").strip()
-        fragments = [f"{idx}. {title}"]
-        if summary:
-            fragments.append(f"Summary: {summary}")
-        if source or platform or region:
-            fragments.append(
-                f"Meta: source={source or 'unknown'}, "
-                f"platform={platform or 'unknown'}, region={region or 'unknown'}"
-            )
-        snippets.append("\n".join(fragments))
-    return "\n\n".join(snippets) if snippets else "(no items)"
+    # One join over a generator: no per-item fragments list and no
+    # intermediate snippets list, which matters at 400 items per chunk
+    return (
+        "\n\n".join(
+            _format_one_verdict_item(idx, item)
+            for idx, item in enumerate(items, start=start_idx)
+        )
+        or "(no items)"
+    )
 
 
 def _build_daily_verdict_prompt(
@@ -307,24 +573,10 @@ def _build_daily_verdict_prompt(
     return f"""You are analyzing news signals for one day.
 Use only the provided items and avoid certainty. Keep the tone neutral and concise.
 
-Return valid JSON only with exactly these keys:
-Each object keys:
-- summary (required, non-empty string)
-- global_political_score (required, integer 0-100)
-- global_economic_score (required, integer 0-100)
-- domestic_political_score (required, integer 0-100)
-- domestic_economic_score (required, integer 0-100)
-
-Scoring rules:
-- 0 means severe instability/crisis, 100 means very stable/healthy conditions.
-- Scores must be integers between 0 and 100.
+{_VERDICT_JSON_KEYS}
 - Base scores on the balance and severity of evidence in the provided items.
 
-Score definitions:
-- global_political_score: Reflects international/geopolitical political stability (wars, diplomacy, international conflicts, global governance).
-- global_economic_score: Reflects international/global economic conditions (trade, global markets, international finance, commodities).
-- domestic_political_score: Reflects domestic/internal political stability (local government, elections, civil unrest, policy changes within countries).
-- domestic_economic_score: Reflects domestic/local economic conditions (employment, local markets, inflation, business conditions within countries).
+{_VERDICT_SCORE_DEFINITIONS}
 
 {lang_instruction}Items:
 {content}"""
@@ -365,29 +617,53 @@ Previous verdict based on items 1-{items_processed}:
 Now analyze the following additional items and UPDATE the verdict by combining insights from both the previous analysis and these new items.
 Use only the provided items and avoid certainty. Keep the tone neutral and concise.
 
-Return valid JSON only with exactly these keys:
-Each object keys:
-- summary (required, non-empty string)
-- global_political_score (required, integer 0-100)
-- global_economic_score (required, integer 0-100)
-- domestic_political_score (required, integer 0-100)
-- domestic_economic_score (required, integer 0-100)
-
-Scoring rules:
-- 0 means severe instability/crisis, 100 means very stable/healthy conditions.
-- Scores must be integers between 0 and 100.
+{_VERDICT_JSON_KEYS}
 - Base scores on the balance and severity of evidence in ALL items analyzed (previous + new).
 
-Score definitions:
-- global_political_score: Reflects international/geopolitical political stability (wars, diplomacy, international conflicts, global governance).
-- global_economic_score: Reflects international/global economic conditions (trade, global markets, international finance, commodities).
-- domestic_political_score: Reflects domestic/internal political stability (local government, elections, civil unrest, policy changes within countries).
-- domestic_economic_score: Reflects domestic/local economic conditions (employment, local markets, inflation, business conditions within countries).
+{_VERDICT_SCORE_DEFINITIONS}
 
 {lang_instruction}Additional items ({items_processed + 1}-{items_processed + len(items)}):
 {content}"""
 
 
+def _build_reduce_verdict_prompt(
+    chunk_verdicts: list[dict[str, Any]],
+    total_items: int,
+    response_language: str | None = None,
+) -> str:
+    """Build prompt merging independent per-chunk verdicts into one."""
+    lang_instruction = ""
+    if response_language and response_language.strip():
+        lang_instruction = (
+            f"Write the daily summary in {response_language.strip()}.\n\n"
+        )
+
+    fragments: list[str] = []
+    for idx, verdict in enumerate(chunk_verdicts, start=1):
+        fragments.append(
+            f"""Batch {idx}:
+- Summary: {verdict.get("summary", "(no summary)")}
+- Global Political Score: {verdict.get("global_political_score", "N/A")}
+- Global Economic Score: {verdict.get("global_economic_score", "N/A")}
+- Domestic Political Score: {verdict.get("domestic_political_score", "N/A")}
+- Domestic Economic Score: {verdict.get("domestic_economic_score", "N/A")}"""
+        )
+    content = "\n\n".join(fragments)
+
+    return f"""You are combining partial analyses of one day's news signals.
+{total_items} items were analyzed in {len(chunk_verdicts)} independent batches; each batch verdict below covers a different subset of the items.
+Merge them into a single verdict for the whole day, weighting each batch by the severity of its evidence.
+Use only the provided batch verdicts and avoid certainty. Keep the tone neutral and concise.
+
+{_VERDICT_JSON_KEYS}
+- Base scores on the balance and severity of evidence across ALL batch verdicts.
+
+{_VERDICT_SCORE_DEFINITIONS}
+
+{lang_instruction}Batch verdicts:
+{content}"""
+
+
 async def summarize_and_label(
     title: str,
     description: str | None,
@@ -397,33 +673,35 @@ async def summarize_and_label(
     api_key: str,
     response_language: str | None = None,
     timeout: float = 30.0,
+    cache_ttl: float = _RESPONSE_CACHE_TTL,
+    cheap_model: str | None = None,
 ) -> tuple[str | None, list[str]]:
     """Call AI to get a short summary and exactly 3 topic labels for the item.
 
     Args:
         response_language: If set, instructs the AI to respond in this language
             for both summary and labels (e.g. "English", "中文", "日本語").
+        cache_ttl: Successful responses are cached for this many seconds,
+            keyed on (model, prompt). 0 disables caching.
+        cheap_model: Optional cheaper/faster model to route short prompts to.
 
     Returns:
         (summary, labels) — summary may be None on parse/API error; labels may be empty.
     """
-    client = AsyncOpenAI(base_url=base_url, api_key=api_key, timeout=timeout)
-
-    try:
-        response = await client.chat.completions.create(
-            model=model,
-            messages=[
-                {
-                    "role": "user",
-                    "content": _build_prompt(title, description, response_language),
-                }
-            ],
-        )
-    except Exception as e:
-        logger.warning("AI request failed: %s", _err_text(e))
+    prompt = _build_prompt(title, description, response_language)
+    if cheap_model and _estimate_tokens(prompt) <= _CHEAP_MODEL_MAX_TOKENS:
+        model = cheap_model
+    key = ai_cache.cache_key(model + "\0" + prompt)
+    if cache_ttl > 0:
+        hit = ai_cache.cache_get(key)
+        if hit is not None:
+            return hit.get("summary"), _normalize_labels(hit.get("labels"))
+
+    content = await _chat(
+        prompt, base_url=base_url, model=model, api_key=api_key, timeout=timeout
+    )
+    if content is None:
         return None, []
-
-    content = response.choices[0].message.content or ""
     content = content.strip()
 
     parsed = _extract_json_text(content)
@@ -436,9 +714,123 @@ async def summarize_and_label(
         summary = str(summary).strip() or None
     labels = _normalize_labels(parsed.get("labels"))
 
+    if cache_ttl > 0 and (summary or labels):
+        ai_cache.cache_set(
+            key, {"summary": summary, "labels": labels}, ttl_seconds=cache_ttl
+        )
     return summary, labels
 
 
+async def summarize_and_label_batch(
+    items: list[tuple[str, str | None]],
+    *,
+    base_url: str,
+    model: str,
+    api_key: str,
+    response_language: str | None = None,
+    timeout: float = 60.0,
+    batch_size: int = 16,
+    cache_ttl: float = _RESPONSE_CACHE_TTL,
+) -> list[tuple[str | None, list[str]]]:
+    """Summarize and label several (title, description) items per API call.
+
+    Amortizes the per-request overhead (connection, prompt preamble,
+    rate-limit tokens) across batch_size items instead of one round-trip
+    per item. Any batch whose response cannot be parsed or comes back
+    with the wrong number of entries falls back to concurrent per-item
+    summarize_and_label calls, so the result list always aligns with the
+    input list.
+    """
+    results: list[tuple[str | None, list[str]]] = []
+    for start in range(0, len(items), batch_size):
+        batch = items[start : start + batch_size]
+        results.extend(
+            await _summarize_batch_once(
+                batch,
+                base_url=base_url,
+                model=model,
+                api_key=api_key,
+                response_language=response_language,
+                timeout=timeout,
+                cache_ttl=cache_ttl,
+            )
+        )
+    return results
+
+
+async def _summarize_batch_once(
+    batch: list[tuple[str, str | None]],
+    *,
+    base_url: str,
+    model: str,
+    api_key: str,
+    response_language: str | None,
+    timeout: float,
+    cache_ttl: float,
+) -> list[tuple[str | None, list[str]]]:
+    """Summarize one batch with a single call, per-item fallback on failure."""
+    prompt = _build_batch_prompt(batch, response_language)
+    key = ai_cache.cache_key(model + "\0" + prompt)
+    entries: Any = None
+    if cache_ttl > 0:
+        hit = ai_cache.cache_get(key)
+        if isinstance(hit, dict):
+            entries = hit.get("results")
+
+    if entries is None:
+        content = await _chat(
+            prompt,
+            base_url=base_url,
+            model=model,
+            api_key=api_key,
+            timeout=timeout,
+            log_label="AI batch",
+        )
+        if content is not None:
+            parsed = _extract_json_text(content.strip())
+            if isinstance(parsed, dict):
+                entries = parsed.get("results")
+
+    if not isinstance(entries, list) or len(entries) != len(batch):
+        logger.warning(
+            "AI batch response misaligned (%s entries for %d items); "
+            "falling back to per-item calls",
+            len(entries) if isinstance(entries, list) else "no",
+            len(batch),
+        )
+        return list(
+            await asyncio.gather(
+                *(
+                    summarize_and_label(
+                        title,
+                        description,
+                        base_url=base_url,
+                        model=model,
+                        api_key=api_key,
+                        response_language=response_language,
+                        timeout=timeout,
+                        cache_ttl=cache_ttl,
+                    )
+                    for title, description in batch
+                )
+            )
+        )
+
+    if cache_ttl > 0:
+        ai_cache.cache_set(key, {"results": entries}, ttl_seconds=cache_ttl)
+
+    results: list[tuple[str | None, list[str]]] = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            results.append((None, []))
+            continue
+        summary = entry.get("summary")
+        if summary is not None:
+            summary = str(summary).strip() or None
+        results.append((summary, _normalize_labels(entry.get("labels"))))
+    return results
+
+
 async def summarize_and_label_from_page(
     title: str,
     page_text: str,
@@ -448,28 +840,30 @@ async def summarize_and_label_from_page(
     api_key: str,
     response_language: str | None = None,
     timeout: float = 35.0,
+    cache_ttl: float = _RESPONSE_CACHE_TTL,
+    cheap_model: str | None = None,
 ) -> tuple[str | None, list[str]]:
     """Call AI to summarize from page text and return labels."""
-    client = AsyncOpenAI(base_url=base_url, api_key=api_key, timeout=timeout)
-
-    try:
-        response = await client.chat.completions.create(
-            model=model,
-            messages=[
-                {
-                    "role": "user",
-                    "content": _build_page_summary_prompt(
-                        title, page_text, response_language
-                    ),
-                }
-            ],
-        )
-    except Exception as e:
-        logger.warning("AI page-summary request failed: %s", _err_text(e))
+    prompt = _build_page_summary_prompt(title, page_text, response_language)
+    if cheap_model and _estimate_tokens(prompt) <= _CHEAP_MODEL_MAX_TOKENS:
+        model = cheap_model
+    key = ai_cache.cache_key(model + "\0" + prompt)
+    if cache_ttl > 0:
+        hit = ai_cache.cache_get(key)
+        if hit is not None:
+            return hit.get("summary"), _normalize_labels(hit.get("labels"))
+
+    content = await _chat(
+        prompt,
+        base_url=base_url,
+        model=model,
+        api_key=api_key,
+        timeout=timeout,
+        log_label="AI page-summary",
+    )
+    if content is None:
         return None, []
 
-    content = response.choices[0].message.content or ""
-
     parsed = _extract_json_text(content)
     if parsed is None or not isinstance(parsed, dict):
         logger.warning("AI page-summary response missing valid JSON")
@@ -479,6 +873,11 @@ async def summarize_and_label_from_page(
     if summary is not None:
         summary = str(summary).strip() or None
     labels = _normalize_labels(parsed.get("labels"))
+
+    if cache_ttl > 0 and (summary or labels):
+        ai_cache.cache_set(
+            key, {"summary": summary, "labels": labels}, ttl_seconds=cache_ttl
+        )
     return summary, labels
 
 
@@ -495,35 +894,37 @@ async def extract_items_from_html(
     timeout: float = 45.0,
 ) -> list[dict[str, Any]]:
     """Call AI to extract structured items from platform page HTML."""
-    client = AsyncOpenAI(base_url=base_url, api_key=api_key, timeout=timeout)
+    prompt = _build_html_extract_prompt(
+        platform=platform,
+        page_url=page_url,
+        html_excerpt=html_excerpt,
+        response_language=response_language,
+        max_items=max_items,
+    )
 
-    try:
-        response = await client.chat.completions.create(
-            model=model,
-            messages=[
-                {
-                    "role": "user",
-                    "content": _build_html_extract_prompt(
-                        platform=platform,
-                        page_url=page_url,
-                        html_excerpt=html_excerpt,
-                        response_language=response_language,
-                        max_items=max_items,
-                    ),
-                }
-            ],
-        )
-    except Exception as e:
-        logger.warning("AI HTML extraction request failed: %s", _err_text(e))
+    content = await _chat(
+        prompt,
+        base_url=base_url,
+        model=model,
+        api_key=api_key,
+        timeout=timeout,
+        log_label="AI HTML extraction",
+    )
+    if content is None:
         return []
 
-    content = response.choices[0].message.content or ""
-
     parsed = _extract_json_text(content)
     if parsed is None:
         logger.warning("AI HTML extraction response missing valid JSON")
         return []
 
+    # json_object response mode forces an object at top level, so some
+    # models wrap the requested array in a single key; unwrap it
+    if isinstance(parsed, dict):
+        parsed = next(
+            (value for value in parsed.values() if isinstance(value, list)), parsed
+        )
+
     return _normalize_extracted_items(parsed, max_items=max_items)
 
 
@@ -588,19 +989,18 @@ async def _call_verdict_api(
 
     If parsing fails, retries up to ai_json_number_retry times.
     """
-    client = AsyncOpenAI(base_url=base_url, api_key=api_key, timeout=timeout)
-
     for attempt in range(ai_json_number_retry):
-        try:
-            response = await client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-            )
-        except Exception as e:
-            logger.warning("Daily AI verdict request failed: %s", _err_text(e))
+        content = await _chat(
+            prompt,
+            base_url=base_url,
+            model=model,
+            api_key=api_key,
+            timeout=timeout,
+            log_label="Daily AI verdict",
+        )
+        if content is None:
             return None
 
-        content = response.choices[0].message.content or ""
         result = _parse_verdict_response(content)
 
         if result is not None:
@@ -690,17 +1090,7 @@ Key Ratios:
 - Revenue Growth (YoY): {pct(report.get("revenue_growth"))}
 - Net Profit Margin: {pct(report.get("profit_margin"))}
 
-{lang_instruction}Return valid JSON only with exactly these keys:
-Each object keys:
-- summary (required, non-empty string)
-- health_score (required, integer 0-100)
-- potential_score (required, integer 0-100)
-
-Scoring rules:
-- health_score (0-100): Current financial health based on profitability, balance sheet strength, cash flow, and debt levels. 0 = near-bankruptcy/critical, 50 = average, 100 = exceptionally strong.
-- potential_score (0-100): Expected performance in the next quarter based on growth trends, market position, and financial trajectory. 0 = severe decline expected, 50 = stable, 100 = strong growth expected.
-- Scores must be integers between 0 and 100.
-- Base scores on the financial data provided. Be realistic and data-driven."""
+{lang_instruction}{_FINANCIAL_JSON_KEYS}"""
 
 
 async def analyze_financial_report(
@@ -712,22 +1102,32 @@ async def analyze_financial_report(
     response_language: str | None = None,
     timeout: float = 45.0,
     ai_json_number_retry: int = 3,
+    cache_ttl: float = _RESPONSE_CACHE_TTL,
 ) -> tuple[str | None, int | None, int | None]:
     """Analyze a financial report using AI and return (summary, health_score, potential_score)."""
     prompt = _build_financial_analysis_prompt(report_data, response_language)
-    client = AsyncOpenAI(base_url=base_url, api_key=api_key, timeout=timeout)
+    key = ai_cache.cache_key(model + "\0" + prompt)
+    if cache_ttl > 0:
+        hit = ai_cache.cache_get(key)
+        if hit is not None:
+            return (
+                hit.get("summary"),
+                _clamp_score(hit.get("health_score")),
+                _clamp_score(hit.get("potential_score")),
+            )
 
     for attempt in range(ai_json_number_retry):
-        try:
-            response = await client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-            )
-        except Exception as e:
-            logger.warning("Financial analysis AI request failed: %s", _err_text(e))
+        content = await _chat(
+            prompt,
+            base_url=base_url,
+            model=model,
+            api_key=api_key,
+            timeout=timeout,
+            log_label="Financial analysis AI",
+        )
+        if content is None:
             return None, None, None
 
-        content = response.choices[0].message.content or ""
         if not content:
             logger.warning("Financial analysis AI response missing content")
             return None, None, None
@@ -749,6 +1149,16 @@ async def analyze_financial_report(
         potential_score = _clamp_score(parsed.get("potential_score"))
 
         if summary and health_score is not None and potential_score is not None:
+            if cache_ttl > 0:
+                ai_cache.cache_set(
+                    key,
+                    {
+                        "summary": summary,
+                        "health_score": health_score,
+                        "potential_score": potential_score,
+                    },
+                    ttl_seconds=cache_ttl,
+                )
             return summary, health_score, potential_score
 
         logger.warning(
@@ -770,13 +1180,16 @@ async def generate_daily_verdict(
     max_items: int = 400,
     timeout: float = 45.0,
     ai_json_number_retry: int = 3,
+    parallel_chunks: bool = True,
 ) -> tuple[str | None, int | None, int | None, int | None, int | None]:
     """Generate daily summary and political/economic scores from collected items.
 
-    If the number of items exceeds max_items, evaluation is done in chunks:
-    - First chunk evaluates items[0:max_items] and produces an initial verdict
-    - Subsequent chunks use the previous verdict as context to evaluate more items
-    - Final verdict incorporates insights from all items
+    If the number of items exceeds max_items, evaluation is done in chunks.
+    By default each chunk is scored independently and concurrently, then a
+    single reduce call merges the per-chunk verdicts — N chunks cost roughly
+    two round-trips of latency instead of N. Pass parallel_chunks=False for
+    the older sequential mode, where each chunk sees the running verdict of
+    everything before it.
 
     Returns:
         (summary, global_political, global_economic, domestic_political, domestic_economic)
@@ -784,8 +1197,40 @@ async def generate_daily_verdict(
     if not items:
         return None, None, None, None, None
 
+    # Duplicate headlines across platforms inflate prompt tokens and can
+    # push the item count into extra chunk calls; keep the first copy of
+    # each title (normalized the same way as _normalize_extracted_items)
+    seen_titles: set[str] = set()
+    deduped: list[dict[str, Any]] = []
+    for item in items:
+        title_key = " ".join(str(item.get("title") or "").lower().split())
+        if title_key:
+            if title_key in seen_titles:
+                continue
+            seen_titles.add(title_key)
+        deduped.append(item)
+    if len(deduped) < len(items):
+        logger.info(
+            "Verdict input deduplicated: %d -> %d items", len(items), len(deduped)
+        )
+        items = deduped
+
     total_items = len(items)
 
+    # Chunking by item count alone can overshoot the context window when
+    # items carry long summaries; shrink the chunk size until the
+    # estimated per-chunk prompt fits a conservative token budget
+    est_tokens = _estimate_tokens(_format_items_for_verdict(items))
+    if est_tokens > _VERDICT_PROMPT_TOKEN_BUDGET:
+        fitting = int(total_items * _VERDICT_PROMPT_TOKEN_BUDGET / est_tokens)
+        if fitting < max_items:
+            max_items = max(1, fitting)
+            logger.info(
+                "Verdict items estimated at %d tokens; reducing chunk size to %d",
+                est_tokens,
+                max_items,
+            )
+
     # If items fit within max_items, do a single evaluation
     if total_items <= max_items:
         prompt = _build_daily_verdict_prompt(items, response_language, max_items)
@@ -816,6 +1261,65 @@ async def generate_daily_verdict(
         max_items,
     )
 
+    if parallel_chunks:
+        # Map: score every chunk concurrently with the standard prompt.
+        # _call_verdict_api returns None on failure, so no exception
+        # handling is needed around the gather.
+        chunk_results = await asyncio.gather(
+            *(
+                _call_verdict_api(
+                    _build_daily_verdict_prompt(
+                        items[start : start + max_items],
+                        response_language,
+                        max_items,
+                    ),
+                    base_url=base_url,
+                    model=model,
+                    api_key=api_key,
+                    timeout=timeout,
+                    ai_json_number_retry=ai_json_number_retry,
+                )
+                for start in range(0, total_items, max_items)
+            )
+        )
+        verdicts = [v for v in chunk_results if v is not None]
+        if not verdicts:
+            return None, None, None, None, None
+        if len(verdicts) < total_chunks:
+            logger.warning(
+                "%d/%d verdict chunks failed; merging the %d that succeeded",
+                total_chunks - len(verdicts),
+                total_chunks,
+                len(verdicts),
+            )
+
+        merged = verdicts[0]
+        if len(verdicts) > 1:
+            # Reduce: one call merges the per-chunk verdicts
+            result = await _call_verdict_api(
+                _build_reduce_verdict_prompt(
+                    verdicts, total_items, response_language
+                ),
+                base_url=base_url,
+                model=model,
+                api_key=api_key,
+                timeout=timeout,
+                ai_json_number_retry=ai_json_number_retry,
+            )
+            if result is None:
+                logger.warning(
+                    "Verdict merge call failed; returning first chunk verdict"
+                )
+            else:
+                merged = result
+        return (
+            merged["summary"],
+            merged["global_political_score"],
+            merged["global_economic_score"],
+            merged["domestic_political_score"],
+            merged["domestic_economic_score"],
+        )
+
     current_verdict: dict[str, Any] | None = None
     items_processed = 0
 
@@ -0,0 +1,78 @@
+"""SQLite-backed TTL cache for AI platform-extraction responses."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = (
+    Path(__file__).resolve().parent.parent.parent / ".cache" / "ai_extract.sqlite3"
+)
+
+_conn: sqlite3.Connection | None = None
+
+
+def cache_key(text: str) -> str:
+    """Return a stable cache key for a prompt payload."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _get_conn() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        DEFAULT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(DEFAULT_CACHE_PATH)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS ai_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        _conn.commit()
+    return _conn
+
+
+def cache_get(key: str) -> Any | None:
+    """Return the cached value for key, or None when missing or expired."""
+    try:
+        conn = _get_conn()
+        row = conn.execute(
+            "SELECT value, expires_at FROM ai_cache WHERE key = ?", (key,)
+        ).fetchone()
+    except Exception as exc:
+        logger.debug("AI cache read failed: %s", exc)
+        return None
+    if row is None:
+        return None
+    value, expires_at = row
+    if expires_at < time.time():
+        try:
+            conn.execute("DELETE FROM ai_cache WHERE key = ?", (key,))
+            conn.commit()
+        except Exception:
+            pass
+        return None
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return None
+
+
+def cache_set(key: str, value: Any, *, ttl_seconds: float) -> None:
+    """Store a JSON-serializable value under key for ttl_seconds."""
+    if ttl_seconds <= 0:
+        return
+    try:
+        conn = _get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO ai_cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, json.dumps(value), time.time() + ttl_seconds),
+        )
+        conn.commit()
+    except Exception as exc:
+        logger.debug("AI cache write failed: %s", exc)
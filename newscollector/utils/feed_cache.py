@@ -0,0 +1,87 @@
+"""SQLite-backed cache of parsed RSS entries keyed by feed URL.
+
+Stores the validators (ETag / Last-Modified) returned by each feed so the
+collector can issue conditional GETs; a 304 response skips both the body
+download and the parse.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = (
+    Path(__file__).resolve().parent.parent.parent / ".cache" / "rss_feeds.sqlite3"
+)
+
+_conn: sqlite3.Connection | None = None
+
+
+@dataclass(frozen=True)
+class CachedFeed:
+    """Validators plus the parsed entries from the last successful fetch."""
+
+    etag: str | None
+    last_modified: str | None
+    entries: list[dict[str, Any]]
+
+
+def _get_conn() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        DEFAULT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(DEFAULT_CACHE_PATH)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS feed_cache ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+            "entries TEXT NOT NULL)"
+        )
+        _conn.commit()
+    return _conn
+
+
+def get(url: str) -> CachedFeed | None:
+    """Return the cached feed for url, or None when absent or unreadable."""
+    try:
+        conn = _get_conn()
+        row = conn.execute(
+            "SELECT etag, last_modified, entries FROM feed_cache WHERE url = ?",
+            (url,),
+        ).fetchone()
+    except Exception as exc:
+        logger.debug("Feed cache read failed: %s", exc)
+        return None
+    if row is None:
+        return None
+    etag, last_modified, entries_json = row
+    try:
+        entries = json.loads(entries_json)
+    except json.JSONDecodeError:
+        return None
+    return CachedFeed(etag=etag, last_modified=last_modified, entries=entries)
+
+
+def set(
+    url: str,
+    *,
+    etag: str | None,
+    last_modified: str | None,
+    entries: list[dict[str, Any]],
+) -> None:
+    """Store the feed's validators and parsed entries."""
+    try:
+        conn = _get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO feed_cache "
+            "(url, etag, last_modified, entries) VALUES (?, ?, ?, ?)",
+            (url, etag, last_modified, json.dumps(entries)),
+        )
+        conn.commit()
+    except Exception as exc:
+        logger.debug("Feed cache write failed: %s", exc)
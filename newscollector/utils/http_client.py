@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import Any
+
 import httpx
+import orjson
 
 # Common browser-like headers to reduce chance of being blocked
 DEFAULT_HEADERS = {
@@ -11,10 +15,23 @@ DEFAULT_HEADERS = {
         "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
     ),
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
     "Accept-Language": "en-US,en;q=0.9",
 }
 
 
+def json_body(resp: httpx.Response) -> Any:
+    """Parse a JSON response body with orjson.
+
+    orjson only accepts UTF-8, so the rare non-UTF-8 body is re-decoded
+    through resp.text, which honors the response charset.
+    """
+    try:
+        return orjson.loads(resp.content)
+    except orjson.JSONDecodeError:
+        return orjson.loads(resp.text)
+
+
 def create_client(
     timeout: float = 30.0,
     headers: dict[str, str] | None = None,
@@ -25,10 +42,42 @@ def create_client(
     The caller is responsible for closing the client (use as async context manager).
     """
     merged_headers = {**DEFAULT_HEADERS, **(headers or {})}
-    transport = httpx.AsyncHTTPTransport(retries=2)
+    transport = httpx.AsyncHTTPTransport(retries=2, http2=True)
     return httpx.AsyncClient(
         headers=merged_headers,
         timeout=httpx.Timeout(timeout),
         follow_redirects=follow_redirects,
         transport=transport,
+        http2=True,
     )
+
+
+# Process-wide client for per-item fetches (page-summary downloads hit the
+# same publisher hosts repeatedly, so keep-alive and HTTP/2 multiplexing pay
+# off). Tied to the running loop and recreated when it changes, matching the
+# playwright_pool pattern; collect_all closes it on shutdown.
+_shared_client: httpx.AsyncClient | None = None
+_shared_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient for the current event loop.
+
+    Callers must not close the returned client; pass per-request options
+    (timeout, headers) to the request methods instead.
+    """
+    global _shared_client, _shared_loop
+    loop = asyncio.get_running_loop()
+    if _shared_loop is not loop or _shared_client is None or _shared_client.is_closed:
+        _shared_client = create_client()
+        _shared_loop = loop
+    return _shared_client
+
+
+async def aclose_shared_client() -> None:
+    """Close the shared client; safe to call when none was created."""
+    global _shared_client, _shared_loop
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_loop = None
@@ -0,0 +1,127 @@
+"""Process-wide shared Playwright browser for scraping collectors.
+
+Launching headless Chromium costs seconds per call while creating a browser
+context is orders of magnitude cheaper, so collectors share one browser and
+open a fresh context per collection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Launch flags shared by every scraping collector; the stealth-oriented ones
+# are harmless for collectors that don't need them
+LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-infobars",
+    "--no-first-run",
+    "--no-default-browser-check",
+    # Subsystems a headless text scraper never exercises; disabling them
+    # trims Chromium RSS and startup time, which adds up when several
+    # collectors share the process
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--mute-audio",
+    "--disable-features=Translate,BackForwardCache,OptimizationHints",
+]
+
+# Containers without a usable kernel sandbox need --no-sandbox; keep it
+# opt-in since it weakens isolation everywhere else
+if os.environ.get("NEWSCOLLECTOR_NO_SANDBOX"):
+    LAUNCH_ARGS.append("--no-sandbox")
+
+_playwright: Any = None
+_browser: Any = None
+_persistent: dict[str, Any] = {}
+_loop: asyncio.AbstractEventLoop | None = None
+_lock: asyncio.Lock | None = None
+
+
+def _ensure_loop_state() -> asyncio.Lock:
+    """Reset pool state when the running loop changed (new asyncio.run)."""
+    global _playwright, _browser, _loop, _lock
+    loop = asyncio.get_running_loop()
+    if _loop is not loop:
+        _playwright = _browser = None
+        _persistent.clear()
+        _lock = asyncio.Lock()
+        _loop = loop
+    return _lock
+
+
+async def _get_playwright() -> Any:
+    global _playwright
+    if _playwright is None:
+        from playwright.async_api import async_playwright
+
+        _playwright = await async_playwright().start()
+    return _playwright
+
+
+async def get_browser() -> Any:
+    """Return the shared Chromium instance, launching it on first use.
+
+    The instance is tied to the running event loop and relaunched when the
+    loop changes (each CLI invocation runs under its own asyncio.run loop).
+    """
+    global _browser
+
+    lock = _ensure_loop_state()
+    async with lock:
+        if _browser is None or not _browser.is_connected():
+            pw = await _get_playwright()
+            _browser = await pw.chromium.launch(headless=True, args=LAUNCH_ARGS)
+    return _browser
+
+
+async def get_persistent_context(user_data_dir: str, **context_opts: Any) -> Any:
+    """Return a shared persistent context backed by user_data_dir.
+
+    Persistent contexts keep the HTTP cache, storage, and fingerprint state
+    on disk between runs — repeat page loads skip re-downloading JS bundles
+    and hostile sites challenge a stable profile less often. The context is
+    shared per directory; callers open and close their own pages.
+    """
+    lock = _ensure_loop_state()
+    async with lock:
+        ctx = _persistent.get(user_data_dir)
+        if ctx is None:
+            pw = await _get_playwright()
+            ctx = await pw.chromium.launch_persistent_context(
+                user_data_dir, headless=True, args=LAUNCH_ARGS, **context_opts
+            )
+            _persistent[user_data_dir] = ctx
+    return ctx
+
+
+async def shutdown() -> None:
+    """Close shared browser state; safe to call when nothing was launched."""
+    global _playwright, _browser, _loop, _lock
+    for ctx in _persistent.values():
+        try:
+            await ctx.close()
+        except Exception as exc:
+            logger.debug("Persistent context close failed: %s", exc)
+    _persistent.clear()
+    if _browser is not None:
+        try:
+            await _browser.close()
+        except Exception as exc:
+            logger.debug("Shared browser close failed: %s", exc)
+        _browser = None
+    if _playwright is not None:
+        try:
+            await _playwright.stop()
+        except Exception as exc:
+            logger.debug("Playwright stop failed: %s", exc)
+        _playwright = None
+    _loop = None
+    _lock = None
@@ -6,7 +6,7 @@ import re
 from html import unescape
 from html.parser import HTMLParser
 
-from newscollector.utils.http_client import create_client
+from newscollector.utils.http_client import get_shared_client
 
 
 class _TextExtractor(HTMLParser):
@@ -33,6 +33,30 @@ class _TextExtractor(HTMLParser):
         return " ".join(self._chunks)
 
 
+# Blocks that dominate rendered-page HTML but carry no extractable content
+_SCRIPT_BLOCK_RE = re.compile(r"<script\b[\s\S]*?</script\s*>", re.IGNORECASE)
+_STYLE_BLOCK_RE = re.compile(r"<style\b[\s\S]*?</style\s*>", re.IGNORECASE)
+_SVG_BLOCK_RE = re.compile(r"<svg\b[\s\S]*?</svg\s*>", re.IGNORECASE)
+_HTML_COMMENT_RE = re.compile(r"<!--[\s\S]*?-->")
+_DATA_URI_ATTR_RE = re.compile(r"""\s[\w-]+=(["'])data:[\s\S]*?\1""")
+
+
+def html_skeleton(html: str) -> str:
+    """Strip script/style/svg blocks, comments, and inline data URIs.
+
+    Rendered pages are mostly webpack bundles and base64 blobs; removing them
+    leaves the markup (tags, hrefs, visible text) that platform-extraction
+    prompts actually read, so a fixed excerpt budget carries far more signal.
+    """
+    raw = html or ""
+    raw = _SCRIPT_BLOCK_RE.sub("", raw)
+    raw = _STYLE_BLOCK_RE.sub("", raw)
+    raw = _SVG_BLOCK_RE.sub("", raw)
+    raw = _HTML_COMMENT_RE.sub("", raw)
+    raw = _DATA_URI_ATTR_RE.sub("", raw)
+    return re.sub(r"\s+", " ", raw).strip()
+
+
 def is_http_url(url: str | None) -> bool:
     """Return True for http(s) URL values."""
     if not url:
@@ -70,10 +94,24 @@ async def fetch_html(
     if not is_http_url(url):
         return None
     try:
-        async with create_client(timeout=timeout) as client:
-            resp = await client.get(url)
+        # Per-item fetches reuse the process-wide client so repeat downloads
+        # from the same publisher skip the TLS handshake
+        client = get_shared_client()
+        async with client.stream("GET", url, timeout=timeout) as resp:
             resp.raise_for_status()
-            html = resp.text or ""
+            if char_limit <= 0:
+                raw = await resp.aread()
+            else:
+                # Stream into a bounded buffer and stop reading once the
+                # character budget is covered (4 bytes per char worst case)
+                byte_cap = char_limit * 4
+                buf = bytearray()
+                async for chunk in resp.aiter_bytes(8192):
+                    buf.extend(chunk)
+                    if len(buf) >= byte_cap:
+                        break
+                raw = bytes(buf)
+            html = raw.decode(resp.encoding or "utf-8", errors="replace")
     except Exception:
         return None
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from newscollector.utils.ai import (
+    _build_batch_prompt,
     _build_page_summary_prompt,
     _build_prompt,
     _clamp_score,
@@ -61,6 +62,13 @@ example here
         raw = "Sure, here's the data: {\"key\": \"value\"}\n\nLet me know if you need more."
         assert _extract_json_text(raw) == {"key": "value"}
 
+    def test_truncated_json(self):
+        # Response cut off mid-payload (token limit) returns None
+        assert _extract_json_text('{"summary": "The day pre') is None
+
+    def test_truncated_fenced_json(self):
+        assert _extract_json_text('```json\n{"a": 1, "b": ') is None
+
 
 class TestFirstChoiceContent:
     def test_valid_choices(self):
@@ -119,6 +127,21 @@ class TestBuildPrompt:
         assert "Respond in" not in prompt
 
 
+class TestBuildBatchPrompt:
+    def test_numbers_items_in_order(self):
+        prompt = _build_batch_prompt([("First", None), ("Second", "Detail")])
+        assert "1. First" in prompt
+        assert "2. Second\nDetail" in prompt
+
+    def test_states_entry_count(self):
+        prompt = _build_batch_prompt([("A", None), ("B", None), ("C", None)])
+        assert "exactly 3 entries" in prompt
+
+    def test_language_instruction(self):
+        prompt = _build_batch_prompt([("T", None)], response_language="中文")
+        assert "中文" in prompt
+
+
 class TestBuildPageSummaryPrompt:
     def test_contains_page_text(self):
         prompt = _build_page_summary_prompt("Title", "Full page content here")
@@ -0,0 +1,45 @@
+"""Tests for newscollector.utils.ai_cache."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from newscollector.utils import ai_cache
+
+
+@pytest.fixture()
+def tmp_cache(tmp_path):
+    """Point the cache at a temp file and reset the cached connection."""
+    with patch.object(ai_cache, "DEFAULT_CACHE_PATH", tmp_path / "cache.sqlite3"):
+        with patch.object(ai_cache, "_conn", None):
+            yield
+
+
+class TestCacheKey:
+    def test_stable(self):
+        assert ai_cache.cache_key("abc") == ai_cache.cache_key("abc")
+
+    def test_differs_by_content(self):
+        assert ai_cache.cache_key("abc") != ai_cache.cache_key("abd")
+
+
+class TestCacheRoundtrip:
+    def test_miss_returns_none(self, tmp_cache):
+        assert ai_cache.cache_get("missing") is None
+
+    def test_set_then_get(self, tmp_cache):
+        value = [{"title": "Hello", "rank": 1}]
+        ai_cache.cache_set("k", value, ttl_seconds=60)
+        assert ai_cache.cache_get("k") == value
+
+    def test_expired_entry_returns_none(self, tmp_cache):
+        ai_cache.cache_set("k", {"a": 1}, ttl_seconds=60)
+        with patch.object(ai_cache.time, "time", return_value=time.time() + 120):
+            assert ai_cache.cache_get("k") is None
+
+    def test_zero_ttl_is_not_stored(self, tmp_cache):
+        ai_cache.cache_set("k", {"a": 1}, ttl_seconds=0)
+        assert ai_cache.cache_get("k") is None
@@ -0,0 +1,43 @@
+"""Tests for newscollector.utils.feed_cache."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from newscollector.utils import feed_cache
+
+
+@pytest.fixture()
+def tmp_cache(tmp_path):
+    """Point the cache at a temp file and reset the cached connection."""
+    with patch.object(feed_cache, "DEFAULT_CACHE_PATH", tmp_path / "cache.sqlite3"):
+        with patch.object(feed_cache, "_conn", None):
+            yield
+
+
+class TestFeedCache:
+    def test_miss_returns_none(self, tmp_cache):
+        assert feed_cache.get("http://example.com/rss") is None
+
+    def test_set_then_get(self, tmp_cache):
+        entries = [{"title": "Headline", "link": "http://e.com/a", "summary": ""}]
+        feed_cache.set(
+            "http://example.com/rss",
+            etag='"abc123"',
+            last_modified="Mon, 01 Jan 2024 00:00:00 GMT",
+            entries=entries,
+        )
+        cached = feed_cache.get("http://example.com/rss")
+        assert cached is not None
+        assert cached.etag == '"abc123"'
+        assert cached.last_modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert cached.entries == entries
+
+    def test_replaces_existing_entry(self, tmp_cache):
+        feed_cache.set("u", etag="old", last_modified=None, entries=[])
+        feed_cache.set("u", etag="new", last_modified=None, entries=[{"title": "T"}])
+        cached = feed_cache.get("u")
+        assert cached.etag == "new"
+        assert cached.entries == [{"title": "T"}]
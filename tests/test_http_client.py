@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import httpx
 
-from newscollector.utils.http_client import DEFAULT_HEADERS, create_client
+from newscollector.utils.http_client import DEFAULT_HEADERS, create_client, json_body
 
 
 class TestCreateClient:
@@ -30,3 +30,25 @@ class TestCreateClient:
     def test_no_follow_redirects(self):
         client = create_client(follow_redirects=False)
         assert client.follow_redirects is False
+
+
+class TestJsonBody:
+    def test_parses_json_body(self):
+        resp = httpx.Response(200, content=b'{"a": 1, "b": [2, 3]}')
+        assert json_body(resp) == {"a": 1, "b": [2, 3]}
+
+    def test_unicode_body(self):
+        resp = httpx.Response(200, content='{"word": "热搜"}'.encode("utf-8"))
+        assert json_body(resp) == {"word": "热搜"}
+
+    def test_non_utf8_charset_falls_back(self):
+        resp = httpx.Response(
+            200,
+            content='{"word": "café"}'.encode("latin-1"),
+            headers={"Content-Type": "application/json; charset=latin-1"},
+        )
+        assert json_body(resp) == {"word": "café"}
+
+    def test_response_json_untouched(self):
+        # The helper must not monkeypatch httpx.Response.json
+        assert httpx.Response.json.__module__.startswith("httpx")
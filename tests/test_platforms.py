@@ -2,21 +2,30 @@
 
 from __future__ import annotations
 
+import xml.etree.ElementTree as ET
 from pathlib import Path
+from urllib.parse import quote
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 import yaml
 
-from newscollector.models import CollectionResult
-from newscollector.platforms.base import BaseCollector
+from newscollector.models import CollectionResult, TrendingItem
+from newscollector.platforms.base import BaseCollector, dedupe_by_heat
 from newscollector.platforms.bilibili import BilibiliCollector
+from newscollector.platforms.douyin import (
+    _extract_render_data_words,
+    _find_word_list,
+)
 from newscollector.platforms.news_rss import (
     NewsRSSCollector,
     _clean_summary,
+    _fast_parse,
     _load_sources,
     _normalize_region,
 )
+from newscollector.platforms.rednote import RedNoteCollector, _extract_note_id
 from newscollector.platforms.twitter import TwitterCollector
 from newscollector.platforms.weibo import WeiboCollector
 from newscollector.platforms.youtube import YouTubeCollector
@@ -72,6 +81,28 @@ class TestBaseCollectorMakeItem:
         assert item.platform == "override"
 
 
+class TestDedupeByHeat:
+    def _item(self, title, heat, rank=1):
+        return TrendingItem(
+            title=title, source="S", platform="dummy", heat=heat, rank=rank
+        )
+
+    def test_keeps_hottest_copy(self):
+        items = [self._item("A", 10), self._item("A", 99), self._item("B", 5)]
+        result = dedupe_by_heat(items, key=lambda i: i.title)
+        assert [(i.title, i.heat) for i in result] == [("A", 99), ("B", 5)]
+
+    def test_reranks_from_one(self):
+        items = [self._item("A", 1, rank=7), self._item("B", 50, rank=3)]
+        result = dedupe_by_heat(items, key=lambda i: i.title)
+        assert [(i.title, i.rank) for i in result] == [("B", 1), ("A", 2)]
+
+    def test_none_heat_sorts_last(self):
+        items = [self._item("A", None), self._item("B", 2)]
+        result = dedupe_by_heat(items, key=lambda i: i.title)
+        assert [i.title for i in result] == ["B", "A"]
+
+
 class TestWeiboCollector:
     @pytest.mark.asyncio
     async def test_parses_hot_search_response(self):
@@ -100,7 +131,7 @@ class TestWeiboCollector:
 
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
-        mock_response.json.return_value = mock_data
+        mock_response.content = orjson.dumps(mock_data)
 
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=mock_response)
@@ -116,6 +147,9 @@ class TestWeiboCollector:
         assert result.success
         assert result.count == 2
         assert result.items[0].title == "热搜话题"
+        assert result.items[0].url == (
+            f"https://s.weibo.com/weibo?q=%23{quote('热搜话题', safe='')}%23"
+        )
         assert result.items[0].heat == 1234567
         assert result.items[0].rank == 1
         assert result.items[1].rank == 2
@@ -158,9 +192,9 @@ class TestBilibiliCollector:
             resp = MagicMock()
             resp.raise_for_status = MagicMock()
             if "ranking" in url:
-                resp.json.return_value = ranking_data
+                resp.content = orjson.dumps(ranking_data)
             else:
-                resp.json.return_value = hot_search_data
+                resp.content = orjson.dumps(hot_search_data)
             return resp
 
         mock_client = AsyncMock()
@@ -183,6 +217,68 @@ class TestBilibiliCollector:
         assert search.title == "热门搜索"
 
 
+class TestDouyinRenderData:
+    def test_extracts_word_list_from_encoded_blob(self):
+        blob = quote(
+            '{"app": {"hotList": {"word_list": ['
+            '{"word": "热搜一", "hot_value": 100},'
+            '{"word": "热搜二", "hot_value": 50}]}}}'
+        )
+        html = f'<html><script id="RENDER_DATA" type="application/json">{blob}</script></html>'
+        words = _extract_render_data_words(html)
+        assert [w["word"] for w in words] == ["热搜一", "热搜二"]
+
+    def test_returns_empty_without_blob(self):
+        assert _extract_render_data_words("<html><body>no data</body></html>") == []
+
+    def test_returns_empty_on_invalid_json(self):
+        html = '<script id="RENDER_DATA">not-json</script>'
+        assert _extract_render_data_words(html) == []
+
+    def test_find_word_list_skips_unrelated_lists(self):
+        data = {
+            "nav": ["home", "hot"],
+            "state": {"word_list": [{"word": "topic", "hot_value": 1}]},
+        }
+        assert _find_word_list(data) == [{"word": "topic", "hot_value": 1}]
+
+    def test_find_word_list_drops_empty_words(self):
+        data = [{"word": "kept"}, {"word": ""}]
+        assert _find_word_list(data) == [{"word": "kept"}]
+
+
+class TestRedNoteNoteId:
+    def test_explore_url(self):
+        url = "https://www.xiaohongshu.com/explore/645b8f4e00000000140266e3"
+        assert _extract_note_id(url) == "645b8f4e00000000140266e3"
+
+    def test_discovery_url(self):
+        url = "https://www.xiaohongshu.com/discovery/item/645b8f4e00000000140266e3"
+        assert _extract_note_id(url) == "645b8f4e00000000140266e3"
+
+    def test_non_post_url(self):
+        assert _extract_note_id("https://www.xiaohongshu.com/user/profile/abc") is None
+
+
+class TestRedNoteCookies:
+    def test_parses_pairs(self):
+        collector = RedNoteCollector({"rednote": {"cookies": "a=1; b=x=y"}})
+        cookies = collector._get_cookies_from_config()
+        assert [(c["name"], c["value"]) for c in cookies] == [("a", "1"), ("b", "x=y")]
+        assert all(c["domain"] == ".xiaohongshu.com" for c in cookies)
+
+    def test_empty_string(self):
+        collector = RedNoteCollector({"rednote": {"cookies": ""}})
+        assert collector._get_cookies_from_config() == []
+
+    def test_cached_for_unchanged_config(self):
+        collector = RedNoteCollector({"rednote": {"cookies": "a=1"}})
+        first = collector._get_cookies_from_config()
+        assert collector._get_cookies_from_config() is first
+        collector.config["rednote"]["cookies"] = "a=2"
+        assert collector._get_cookies_from_config() is not first
+
+
 # RSS Collector Tests
 class TestNormalizeRegion:
     def test_lowercase(self):
@@ -261,6 +357,52 @@ class TestLoadSources:
             assert _load_sources() == {}
 
 
+class TestFastParse:
+    def test_parses_rss(self):
+        data = b"""<?xml version="1.0" encoding="UTF-8" ?>
+        <rss version="2.0"><channel>
+          <item>
+            <title>Headline</title>
+            <link>https://example.com/a</link>
+            <description>Summary text</description>
+          </item>
+        </channel></rss>"""
+        entries = _fast_parse(data)
+        assert entries == [
+            {
+                "title": "Headline",
+                "link": "https://example.com/a",
+                "summary": "Summary text",
+            }
+        ]
+
+    def test_parses_atom(self):
+        data = b"""<?xml version="1.0" encoding="UTF-8"?>
+        <feed xmlns="http://www.w3.org/2005/Atom">
+          <entry>
+            <title>Atom Headline</title>
+            <link rel="alternate" href="https://example.com/b"/>
+            <summary>Atom summary</summary>
+          </entry>
+        </feed>"""
+        entries = _fast_parse(data)
+        assert entries[0]["title"] == "Atom Headline"
+        assert entries[0]["link"] == "https://example.com/b"
+        assert entries[0]["summary"] == "Atom summary"
+
+    def test_caps_at_twenty_entries(self):
+        items = b"".join(
+            b"<item><title>T%d</title><link>https://e.com/%d</link></item>" % (i, i)
+            for i in range(30)
+        )
+        data = b"<rss><channel>" + items + b"</channel></rss>"
+        assert len(_fast_parse(data)) == 20
+
+    def test_raises_on_malformed_xml(self):
+        with pytest.raises(ET.ParseError):
+            _fast_parse(b"<html><p>not a feed")
+
+
 class TestNewsRSSCollector:
     @pytest.mark.asyncio
     async def test_no_sources_error(self):
@@ -350,14 +492,14 @@ class TestTwitterCollector:
 
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
-        mock_response.json.return_value = [
+        mock_response.content = orjson.dumps([
             {
                 "trends": [
                     {"name": "#Trending1", "url": "http://twitter.com/search?q=1", "tweet_volume": 10000},
                     {"name": "#Trending2", "url": "http://twitter.com/search?q=2", "tweet_volume": 5000},
                 ]
             }
-        ]
+        ])
 
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=mock_response)
@@ -409,7 +551,7 @@ class TestYouTubeCollector:
 
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "items": [
                 {
                     "id": "abc123",
@@ -440,7 +582,7 @@ class TestYouTubeCollector:
                     },
                 },
             ]
-        }
+        })
 
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=mock_response)
@@ -466,7 +608,7 @@ class TestYouTubeCollector:
 
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
-        mock_response.json.return_value = {"items": []}
+        mock_response.content = orjson.dumps({"items": []})
 
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=mock_response)
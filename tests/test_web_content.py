@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from newscollector.utils.web_content import html_to_text, is_http_url, truncate_text
+from newscollector.utils.web_content import (
+    html_skeleton,
+    html_to_text,
+    is_http_url,
+    truncate_text,
+)
 
 
 class TestIsHttpUrl:
@@ -63,6 +68,31 @@ class TestHtmlToText:
         assert "  " not in text
 
 
+class TestHtmlSkeleton:
+    def test_strips_script_blocks(self):
+        html = '<div>Card</div><script>window.__x = {"big": "bundle"};</script>'
+        result = html_skeleton(html)
+        assert "Card" in result
+        assert "bundle" not in result
+
+    def test_strips_style_svg_and_comments(self):
+        html = (
+            "<style>.a{color:red}</style><svg><path d='M0 0'/></svg>"
+            "<!-- tracking --><span>Kept</span>"
+        )
+        result = html_skeleton(html)
+        assert result == "<span>Kept</span>"
+
+    def test_strips_data_uris_but_keeps_hrefs(self):
+        html = '<a href="/explore/abc"><img src="data:image/png;base64,AAAA"></a>'
+        result = html_skeleton(html)
+        assert 'href="/explore/abc"' in result
+        assert "base64" not in result
+
+    def test_empty(self):
+        assert html_skeleton("") == ""
+
+
 class TestTruncateText:
     def test_under_limit(self):
         assert truncate_text("short", char_limit=100) == "short"